@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import importlib
-from typing import Dict, Iterable, Type
+from typing import Dict, Iterable, Set, Type
 
 from .simnode import SimNode
 
 
 _registry: Dict[str, Type[SimNode]] = {}
+# Module names already imported by :func:`load_plugins`.
+_loaded: Set[str] = set()
 
 
 def register_node_type(name: str, cls: Type[SimNode]) -> None:
@@ -23,6 +25,13 @@ def get_node_type(name: str) -> Type[SimNode]:
 
 
 def load_plugins(module_names: Iterable[str]) -> None:
-    """Import modules to register their node types."""
+    """Import modules to register their node types.
+
+    Modules loaded by an earlier call are skipped without going through the
+    import machinery again.
+    """
     for module in module_names:
+        if module in _loaded:
+            continue
         importlib.import_module(module)
+        _loaded.add(module)
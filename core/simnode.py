@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+from array import array
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 
 EventHandler = Callable[["SimNode", str, Dict[str, Any]], Any]
@@ -19,12 +20,57 @@ class SimNode:
         Optional name for the node. Defaults to class name.
     parent:
         Optional parent node in the tree.
+
+    Notes
+    -----
+    The core hierarchy and event bus attributes live in ``__slots__``.
+    Subclasses that do not declare ``__slots__`` themselves still receive a
+    regular ``__dict__`` for their own state, while small, numerous node
+    types (e.g. buildings) can declare slots to avoid the per-instance dict.
     """
 
+    __slots__ = (
+        "name",
+        "parent",
+        "children",
+        "_children_by_type",
+        "_iter_children",
+        "_children_dirty",
+        "_listeners",
+        "_manual_update",
+    )
+
+    # Attributes describing the tree structure rather than node state; they
+    # are never included in :meth:`serialize` output.
+    _STRUCTURAL_ATTRS = frozenset(
+        {
+            "name",
+            "parent",
+            "children",
+            "_children_by_type",
+            "_listeners",
+            "_iter_children",
+            "_children_dirty",
+        }
+    )
+
+    # Per-instance state rebuilt at runtime rather than configured (lookup
+    # caches, random streams, derived buffers). Subclasses extend it with
+    # ``Base._TRANSIENT_ATTRS | {...}``; :meth:`serialize` skips it too.
+    _TRANSIENT_ATTRS: FrozenSet[str] = frozenset()
+
+    # Bumped by every ``add_child``/``add_children``/``remove_child`` call
+    # anywhere in the process, so caches derived from ancestry (such as a
+    # node's root) can tell that some subtree was attached or detached.
+    _structure_version = 0
+
     def __init__(self, name: Optional[str] = None, parent: Optional["SimNode"] = None) -> None:
         self.name = name or self.__class__.__name__
         self.parent = parent
         self.children: List[SimNode] = []
+        # Children grouped by their exact class, kept in sync by
+        # ``add_child``/``remove_child`` for cheap typed lookups.
+        self._children_by_type: Dict[type, List[SimNode]] = {}
         # Cached immutable view of ``children`` used for iteration without
         # repeated list copying. Marked dirty whenever the children list
         # changes.
@@ -45,13 +91,53 @@ class SimNode:
         """Attach *node* as a child of this node."""
         node.parent = self
         self.children.append(node)
+        self._children_by_type.setdefault(type(node), []).append(node)
         self._children_dirty = True
+        SimNode._structure_version += 1
+
+    def add_children(self, nodes: Iterable["SimNode"]) -> None:
+        """Attach every node in *nodes* as children, in order.
+
+        Equivalent to calling :meth:`add_child` for each node but resolves
+        the child list and type index once for the whole batch.
+        """
+        children = self.children
+        by_type = self._children_by_type
+        added = False
+        for node in nodes:
+            node.parent = self
+            children.append(node)
+            by_type.setdefault(type(node), []).append(node)
+            added = True
+        if added:
+            self._children_dirty = True
+            SimNode._structure_version += 1
 
     def remove_child(self, node: "SimNode") -> None:
         """Remove *node* from children."""
         self.children.remove(node)
+        self._children_by_type[type(node)].remove(node)
         node.parent = None
         self._children_dirty = True
+        SimNode._structure_version += 1
+
+    def get_children_of_type(self, cls: type) -> List["SimNode"]:
+        """Return direct children whose class is exactly *cls*.
+
+        Subclasses of *cls* are not included. The lookup reads the per-type
+        index maintained by ``add_child``/``remove_child`` instead of
+        scanning ``children``.
+        """
+        return list(self._children_by_type.get(cls, ()))
+
+    def get_child_of_type(self, cls: type) -> Optional["SimNode"]:
+        """Return the first direct child whose class is exactly *cls*.
+
+        Like :meth:`get_children_of_type` but without copying the index
+        list; ``None`` is returned when there is no such child.
+        """
+        children = self._children_by_type.get(cls)
+        return children[0] if children else None
 
     # ------------------------------------------------------------------
     # Event bus
@@ -199,22 +285,34 @@ class SimNode:
             return [self._serialize_value(v) for v in value]
         if isinstance(value, dict):
             return {k: self._serialize_value(v) for k, v in value.items()}
+        if isinstance(value, array):
+            return value.tolist()
         return value
 
+    def _iter_state(self):
+        """Yield ``(name, value)`` pairs for slot and instance attributes."""
+        seen = set()
+        for cls in reversed(type(self).__mro__):
+            for attr in cls.__dict__.get("__slots__", ()):
+                if attr in seen or attr == "__dict__":
+                    continue
+                seen.add(attr)
+                try:
+                    yield attr, getattr(self, attr)
+                except AttributeError:
+                    continue
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            yield from instance_dict.items()
+
     def serialize(self) -> Dict[str, Any]:
         """Return a serialisable representation of this node with state."""
+        structural = self._STRUCTURAL_ATTRS
+        transient = self._TRANSIENT_ATTRS
         state = {
             k: self._serialize_value(v)
-            for k, v in self.__dict__.items()
-            if k
-            not in {
-                "name",
-                "parent",
-                "children",
-                "_listeners",
-                "_iter_children",
-                "_children_dirty",
-            }
+            for k, v in self._iter_state()
+            if k not in structural and k not in transient
         }
         return {
             "name": self.name,
@@ -4,11 +4,13 @@ from .building import BuildingNode  # noqa: F401
 from .resource import ResourceNode  # noqa: F401
 from .worker import WorkerNode  # noqa: F401
 from .builder import BuilderNode  # noqa: F401
+from .road import RoadLayerNode  # noqa: F401
 
 __all__ = [
     "BuildingNode",
     "ResourceNode",
     "WorkerNode",
     "BuilderNode",
+    "RoadLayerNode",
 ]
 
@@ -19,6 +19,8 @@ class ArmyNode(SimNode):
         Number of unit groups in the army.
     """
 
+    __slots__ = ("goal", "size")
+
     def __init__(self, goal: str, size: int = 0, **kwargs) -> None:
         super().__init__(**kwargs)
         self.goal = goal
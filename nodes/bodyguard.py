@@ -8,6 +8,8 @@ from core.plugins import register_node_type
 class BodyguardUnitNode(UnitNode):
     """Small elite unit dedicated to protecting a general."""
 
+    __slots__ = ()
+
     def __init__(self, size: int = 5, **kwargs) -> None:
         super().__init__(size=size, **kwargs)
 
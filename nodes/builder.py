@@ -1,7 +1,7 @@
 """Builder unit node capable of establishing new cities and roads."""
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Callable, Dict, Iterable, Sequence
 
 from core.plugins import register_node_type
 from core.simnode import SimNode
@@ -9,11 +9,65 @@ from nodes.worker import WorkerNode
 from nodes.building import BuildingNode
 from nodes.transform import TransformNode
 from nodes.nation import NationNode
+from nodes.road import RoadLayerNode
+from systems.pathfinding import PathfindingSystem
+
+
+def _round_tile(position: Sequence[float]) -> tuple[int, int]:
+    """Return the integer tile containing ``position``."""
+
+    return int(round(position[0])), int(round(position[1]))
+
+
+def _too_close(
+    cities: Iterable[tuple[float, float]], gx: int, gy: int, r2: float
+) -> bool:
+    """Return ``True`` if ``(gx, gy)`` lies within ``sqrt(r2)`` of any city."""
+
+    for cx, cy in cities:
+        dx = gx - cx
+        dy = gy - cy
+        if dx * dx + dy * dy < r2:
+            return True
+    return False
+
+
+# ``simulation.war.war_loader`` imports this module, so its ``sim_params`` is
+# resolved lazily on first use and cached here afterwards.
+_SIM_PARAMS: dict | None = None
+
+
+def _war_sim_params() -> dict | None:
+    """Return the war simulation's ``sim_params`` or ``None`` if unavailable."""
+
+    global _SIM_PARAMS
+    if _SIM_PARAMS is None:
+        try:  # pragma: no cover - best effort fallback
+            from simulation.war.war_loader import sim_params
+        except Exception:  # pragma: no cover - sim params not available
+            return None
+        _SIM_PARAMS = sim_params
+    return _SIM_PARAMS
 
 
 class BuilderNode(WorkerNode):
     """Worker specialised in constructing cities and connecting roads."""
 
+    __slots__ = (
+        "build_duration",
+        "_build_elapsed",
+        "_build_origin",
+        "_build_position",
+        "_home_tile",
+        "_last_tile",
+        "_returning",
+    )
+
+    # Tick handler per state, filled in after the class body. A returning
+    # builder is dispatched as ``"returning"`` (unless it is building) even
+    # when movement has overwritten ``state`` on the way home.
+    _STATE_HANDLERS: Dict[str, Callable[["BuilderNode", float], bool]]
+
     def __init__(self, build_duration: float | None = None, **kwargs) -> None:
         """Initialize the builder.
 
@@ -26,12 +80,10 @@ class BuilderNode(WorkerNode):
         """
 
         if build_duration is None:
-            try:  # pragma: no cover - best effort fallback
-                from simulation.war.war_loader import sim_params
-
-                build_duration = sim_params.get("build_duration", 7200.0)
-            except Exception:  # pragma: no cover - sim params not available
-                build_duration = 7200.0
+            params = _war_sim_params()
+            build_duration = (
+                params.get("build_duration", 7200.0) if params is not None else 7200.0
+            )
 
         super().__init__(**kwargs)
         self.build_duration = build_duration
@@ -79,34 +131,36 @@ class BuilderNode(WorkerNode):
                 path.append((x1, y1))
         return path
 
+    # ------------------------------------------------------------------
+    def _find_nation(self) -> NationNode | None:
+        """Return the closest :class:`NationNode` ancestor, if any."""
+
+        cur = self.parent
+        while cur is not None:
+            if isinstance(cur, NationNode):
+                return cur
+            cur = cur.parent
+        return None
+
     # ------------------------------------------------------------------
     def begin_construction(self, position: tuple[int, int], origin: SimNode) -> None:
         self.state = "building"
-        self._build_position = (int(round(position[0])), int(round(position[1])))
+        self._build_position = _round_tile(position)
         self._build_origin = origin
         # Builders always return to their nation's capital once construction
         # completes.  Store the capital tile as the home location so the unit
         # can head back there after raising a new city.
-        nation: NationNode | None = None
-        cur = self.parent
-        while cur is not None:
-            if isinstance(cur, NationNode):
-                nation = cur
-                break
-            cur = cur.parent
+        nation = self._find_nation()
         if nation is not None:
-            cx, cy = nation.capital_position
-            self._home_tile = (int(round(cx)), int(round(cy)))
+            self._home_tile = _round_tile(nation.capital_position)
         else:  # pragma: no cover - fallback when nation is missing
             origin_tr = self._get_transform(origin)
             self._home_tile = (
-                (int(round(origin_tr.position[0])), int(round(origin_tr.position[1])))
-                if origin_tr is not None
-                else None
+                _round_tile(origin_tr.position) if origin_tr is not None else None
             )
         self._build_elapsed = 0.0
         scheduler = self._find_scheduler()
-        if scheduler is not None:
+        if scheduler is not None and scheduler.interval_of(self) != self.update_interval:
             scheduler.unschedule(self)
             scheduler.schedule(self, self.update_interval)
 
@@ -121,55 +175,66 @@ class BuilderNode(WorkerNode):
         """Create a city at ``position`` and link it to ``last_infrastructure``.
 
         A :class:`BuildingNode` of type ``"city"`` is created at the supplied
-        coordinates. For each intermediate tile on the path between the last
-        infrastructure and the new city, a ``BuildingNode`` of type ``"road"``
-        is added as well.
+        coordinates. Every intermediate tile on the path between the last
+        infrastructure and the new city is recorded in the root's
+        :class:`RoadLayerNode`.
 
         Returns the newly created city node or ``None`` if the operation could
         not be completed (e.g. missing transforms or pathfinder).
         """
 
-        # Resolve root of the simulation tree
-        root = self
-        while root.parent is not None:
-            root = root.parent
+        return self._build_city_impl(
+            self._find_root(),
+            self._find_nation(),
+            self._find_pathfinder(),
+            position,
+            last_infrastructure,
+            emit_idle=emit_idle,
+            build_roads=build_roads,
+        )
+
+    # ------------------------------------------------------------------
+    def _build_city_impl(
+        self,
+        root: SimNode,
+        nation: NationNode | None,
+        pathfinder: PathfindingSystem | None,
+        position: Iterable[int] | tuple[int, int],
+        last_infrastructure: SimNode,
+        *,
+        emit_idle: bool,
+        build_roads: bool,
+    ) -> BuildingNode | None:
+        """Body of :meth:`build_city` with tree lookups already resolved."""
 
         # Determine start position from the last infrastructure
         start_tr = self._get_transform(last_infrastructure)
         if start_tr is None:
             return None
 
-        goal_x, goal_y = int(round(position[0])), int(round(position[1]))
+        goal_x, goal_y = _round_tile(position)
 
         # Prevent building too close to existing cities
-        nation: NationNode | None = None
-        cur = self.parent
-        while cur is not None:
-            if isinstance(cur, NationNode):
-                nation = cur
-                break
-            cur = cur.parent
         if nation is not None:
             radius = getattr(nation, "city_influence_radius", 0)
-            for cx, cy in nation.cities_positions:
-                dx = goal_x - cx
-                dy = goal_y - cy
-                if dx * dx + dy * dy < radius * radius:
-                    # Too close to an existing city; abort construction and
-                    # return the builder to exploration so it can seek another
-                    # location.
-                    self.state = "exploring"
-                    if emit_idle:
-                        self.emit("unit_idle", {}, direction="up")
-                    return None
-
-        start = (
-            int(round(start_tr.position[0])),
-            int(round(start_tr.position[1])),
-        )
+            # A city on the goal tile is always within a positive radius, so
+            # the O(1) set lookup settles that case before the scan. A
+            # radius of 0 places no restriction at all.
+            if radius > 0 and (
+                nation.has_city(goal_x, goal_y)
+                or _too_close(nation.cities_positions, goal_x, goal_y, radius * radius)
+            ):
+                # Too close to an existing city; abort construction and
+                # return the builder to exploration so it can seek another
+                # location.
+                self.state = "exploring"
+                if emit_idle:
+                    self.emit("unit_idle", {}, direction="up")
+                return None
+
+        start = _round_tile(start_tr.position)
 
         # Compute path using the existing pathfinding system if available
-        pathfinder = self._find_pathfinder()
         path: list[tuple[int, int]] = []
         if pathfinder is not None:
             path = pathfinder.find_path(start, (goal_x, goal_y))
@@ -184,12 +249,10 @@ class BuilderNode(WorkerNode):
 
         # Create road segments along the path (excluding endpoints)
         if build_roads:
-            for x, y in path[1:-1]:
-                road = BuildingNode(parent=root, type="road")
-                TransformNode(parent=road, position=[x, y])
+            RoadLayerNode.for_root(root).add_tiles(path[1:-1])
 
         if nation is not None:
-            nation.cities_positions.append((goal_x, goal_y))
+            nation.add_city(goal_x, goal_y)
 
         # Return to exploration after construction so the builder may seek
         # the next expansion target.
@@ -219,109 +282,136 @@ class BuilderNode(WorkerNode):
         built: list[BuildingNode] = []
         covered: set[tuple[int, int]] = set()
         current = last_infrastructure
+        root = self._find_root()
+        nation = self._find_nation()
         pathfinder = self._find_pathfinder()
 
         start_tr = self._get_transform(last_infrastructure)
         if start_tr is not None:
-            covered.add(
-                (int(round(start_tr.position[0])), int(round(start_tr.position[1])))
-            )
+            covered.add(_round_tile(start_tr.position))
 
         for pos in positions:
             if max_cities is not None and len(built) >= max_cities:
                 break
 
-            goal = (int(round(pos[0])), int(round(pos[1])))
+            goal = _round_tile(pos)
             path: list[tuple[int, int]] = []
             if pathfinder is not None:
                 start_tr = self._get_transform(current)
                 if start_tr is None:
                     break
-                start = (
-                    int(round(start_tr.position[0])),
-                    int(round(start_tr.position[1])),
-                )
+                start = _round_tile(start_tr.position)
                 path = pathfinder.find_path(start, goal)
-            prospective = set(path or [goal])
-            if max_coverage is not None and len(covered | prospective) > max_coverage:
+            prospective = frozenset(path) if path else {goal}
+            new_tiles = prospective - covered
+            if max_coverage is not None and len(covered) + len(new_tiles) > max_coverage:
                 break
-            city = self.build_city(goal, current, emit_idle=False)
+            city = self._build_city_impl(
+                root,
+                nation,
+                pathfinder,
+                goal,
+                current,
+                emit_idle=False,
+                build_roads=True,
+            )
             if city is None:
                 break
             built.append(city)
-            covered.update(prospective)
+            covered |= new_tiles
             current = city
 
         return built
 
+    # ------------------------------------------------------------------
+    def _tick_building(self, dt: float) -> bool:
+        """Advance construction and start heading home once finished."""
+
+        self._build_elapsed += dt
+        if (
+            self._build_elapsed < self.build_duration
+            or self._build_origin is None
+            or self._build_position is None
+        ):
+            return False
+        city = self.build_city(
+            self._build_position,
+            self._build_origin,
+            emit_idle=False,
+            build_roads=False,
+        )
+        if city is None:
+            return False
+        self.emit("city_built", {"city": city}, direction="up")
+        pathfinder = self._find_pathfinder()
+        start_tr = self._get_transform(city)
+        if pathfinder is not None and start_tr is not None and self._home_tile is not None:
+            start = _round_tile(start_tr.position)
+            goal = self._home_tile
+            path = pathfinder.find_path(start, goal)
+            if path:
+                self._path = path[1:]
+                self.target = [goal[0], goal[1]]
+        self.state = "returning"
+        self._returning = True
+        tr = self._get_transform(self)
+        if tr is not None:
+            self._last_tile = _round_tile(tr.position)
+        self._build_origin = None
+        self._build_position = None
+        return False
+
+    # ------------------------------------------------------------------
+    def _tick_returning(self, dt: float) -> bool:
+        """Lay road behind the builder; return ``True`` once it is home."""
+
+        tr = self._get_transform(self)
+        if tr is None:
+            return False
+        tile = _round_tile(tr.position)
+        if tile != self._last_tile and tile != self._home_tile:
+            RoadLayerNode.for_root(self._find_root()).add_tile(tile[0], tile[1])
+            self._last_tile = tile
+        if tile != self._home_tile:
+            return False
+        scheduler = self._find_scheduler()
+        if scheduler is not None:
+            scheduler.unschedule(self)
+        self._returning = False
+        parent = self.parent
+        if parent is not None:
+            parent.remove_child(self)
+        return True
+
+    # ------------------------------------------------------------------
+    def _tick_idle(self, dt: float) -> bool:
+        """Drop an idle builder from the scheduler if it is still on it."""
+
+        if not self._manual_update:
+            # Not scheduled: nothing to undo.
+            return False
+        scheduler = self._find_scheduler()
+        if scheduler is not None:
+            scheduler.unschedule(self)
+        return False
+
     # ------------------------------------------------------------------
     def update(self, dt: float) -> None:
-        if self.state == "building":
-            self._build_elapsed += dt
-            if (
-                self._build_elapsed >= self.build_duration
-                and self._build_origin is not None
-                and self._build_position is not None
-            ):
-                city = self.build_city(
-                    self._build_position,
-                    self._build_origin,
-                    emit_idle=False,
-                    build_roads=False,
-                )
-                if city is not None:
-                    self.emit("city_built", {"city": city}, direction="up")
-                    pathfinder = self._find_pathfinder()
-                    start_tr = self._get_transform(city)
-                    if (
-                        pathfinder is not None
-                        and start_tr is not None
-                        and self._home_tile is not None
-                    ):
-                        start = (
-                            int(round(start_tr.position[0])),
-                            int(round(start_tr.position[1])),
-                        )
-                        goal = self._home_tile
-                        path = pathfinder.find_path(start, goal)
-                        if path:
-                            self._path = path[1:]
-                            self.target = [goal[0], goal[1]]
-                    self.state = "returning"
-                    self._returning = True
-                    tr = self._get_transform(self)
-                    if tr is not None:
-                        self._last_tile = (
-                            int(round(tr.position[0])),
-                            int(round(tr.position[1])),
-                        )
-                    self._build_origin = None
-                    self._build_position = None
-        elif self._returning:
-            tr = self._get_transform(self)
-            if tr is not None:
-                tile = (int(round(tr.position[0])), int(round(tr.position[1])))
-                if tile != self._last_tile and tile != self._home_tile:
-                    root = self
-                    while root.parent is not None:
-                        root = root.parent
-                    road = BuildingNode(parent=root, type="road")
-                    TransformNode(parent=road, position=[tile[0], tile[1]])
-                    self._last_tile = tile
-                if tile == self._home_tile:
-                    scheduler = self._find_scheduler()
-                    if scheduler is not None:
-                        scheduler.unschedule(self)
-                    self._returning = False
-                    parent = self.parent
-                    if parent is not None:
-                        parent.remove_child(self)
-                    return
-        elif self.state == "idle":
-            scheduler = self._find_scheduler()
-            if scheduler is not None:
-                scheduler.unschedule(self)
+        state = self.state
+        if self._returning and state != "building":
+            state = "returning"
+        handler = self._STATE_HANDLERS.get(state)
+        if handler is not None and handler(self, dt):
+            # The builder left the tree; do not advance its children.
+            return
         super().update(dt)
 
 
+BuilderNode._STATE_HANDLERS = {
+    "building": BuilderNode._tick_building,
+    "returning": BuilderNode._tick_returning,
+    "idle": BuilderNode._tick_idle,
+}
+
+
 register_node_type("BuilderNode", BuilderNode)
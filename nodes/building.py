@@ -1,6 +1,8 @@
 """Building node representing structures in the simulation."""
 from __future__ import annotations
 
+import sys
+
 from core.simnode import SimNode
 from core.plugins import register_node_type
 
@@ -21,6 +23,10 @@ class BuildingNode(SimNode):
         conditions.
     """
 
+    # Buildings (cities, roads) are created in large numbers, so avoid the
+    # per-instance ``__dict__``.
+    __slots__ = ("type", "capacity", "hit_points", "strategic")
+
     def __init__(
         self,
         type: str,
@@ -30,7 +36,9 @@ class BuildingNode(SimNode):
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
-        self.type = type
+        # Interned so buildings of the same type share one string object and
+        # type comparisons / type-keyed dict lookups stay cheap.
+        self.type = sys.intern(type)
         self.capacity = capacity
         self.hit_points = hit_points
         self.strategic = strategic
@@ -1,13 +1,57 @@
 """General node representing a military leader in the war simulation."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, List
-import random
 import time
 
 from core.simnode import SimNode
 from core.plugins import register_node_type
+from nodes.army import ArmyNode
 from nodes.strategist import StrategistNode
+from nodes.world import world_rng
+
+
+# Base score of each action, indexed through ``_ACTION_IDX``.
+_BASE = (1.0, 0.9, 0.6, 0.3)
+_ACTION_IDX = {"advance": 0, "flank": 1, "hold": 2, "retreat": 3}
+_ACTIONS = ("advance", "flank", "hold", "retreat")
+
+
+def _score_action(
+    style: str,
+    caution_level: float,
+    intel_confidence: float,
+    action: str,
+    terrain_bonus: float,
+) -> float:
+    """Score *action* for a general with the given parameters."""
+
+    base = _BASE[_ACTION_IDX[action]]
+    score = base * intel_confidence * (1 - caution_level)
+    score += terrain_bonus
+    if action == "retreat":
+        score += caution_level
+    elif action == "hold":
+        score += caution_level * 0.5
+    if style == "aggressive" and action in {"advance", "flank"}:
+        score += 0.1
+    if style == "defensive" and action in {"hold", "retreat"}:
+        score += 0.1
+    return score
+
+
+# The terrain bonus shifts every action's score equally, so it never changes
+# the chosen goal and is not part of the cache key.
+@lru_cache(maxsize=256)
+def _best_action(style: str, caution_level: float, intel_confidence: float) -> str:
+    """Return the highest scoring action for the given parameters."""
+
+    scores = {
+        a: _score_action(style, caution_level, intel_confidence, a, 0.0)
+        for a in _ACTIONS
+    }
+    return max(scores, key=scores.get)
 
 
 class GeneralNode(SimNode):
@@ -56,9 +100,13 @@ class GeneralNode(SimNode):
 
     # ------------------------------------------------------------------
     def get_armies(self) -> List[SimNode]:
-        """Return direct child nodes considered armies."""
+        """Return direct children that are :class:`ArmyNode` instances.
 
-        return [c for c in self.children if c.__class__.__name__ == "ArmyNode"]
+        Like :meth:`NationNode.get_armies`, children match by exact class
+        rather than by class name.
+        """
+
+        return self.get_children_of_type(ArmyNode)
 
     # ------------------------------------------------------------------
     def attempt_flank(self, army: SimNode) -> bool:
@@ -68,7 +116,7 @@ class GeneralNode(SimNode):
         changed to ``"flank"``.
         """
 
-        success = random.random() < self.flank_success_chance
+        success = world_rng(self).random() < self.flank_success_chance
         if success:
             army.change_goal("flank")
         return success
@@ -83,24 +131,21 @@ class GeneralNode(SimNode):
 
     # ------------------------------------------------------------------
     def _score_action(self, action: str, terrain_bonus: float) -> float:
-        base = {"advance": 1.0, "flank": 0.9, "hold": 0.6, "retreat": 0.3}[action]
-        score = base * self.intel_confidence * (1 - self.caution_level)
-        score += terrain_bonus
-        if action == "retreat":
-            score += self.caution_level
-        elif action == "hold":
-            score += self.caution_level * 0.5
-        if self.style == "aggressive" and action in {"advance", "flank"}:
-            score += 0.1
-        if self.style == "defensive" and action in {"hold", "retreat"}:
-            score += 0.1
-        return score
+        return _score_action(
+            self.style, self.caution_level, self.intel_confidence, action, terrain_bonus
+        )
+
+    # ------------------------------------------------------------------
+    def _best_action(self) -> str:
+        """Return the highest scoring action, memoised per parameters."""
+
+        return _best_action(self.style, self.caution_level, self.intel_confidence)
 
     # ------------------------------------------------------------------
     def _decide(self) -> None:
         """Adjust armies' goals based on strategist intel."""
 
-        strategist = next((c for c in self.children if isinstance(c, StrategistNode)), None)
+        strategist = self.get_child_of_type(StrategistNode)
         if strategist is None:
             return
 
@@ -108,13 +153,7 @@ class GeneralNode(SimNode):
         if not intel:
             return
 
-        terrain_bonus = 0.0
-        if intel:
-            terrain_bonus = sum(r.get("terrain_bonus", 0.0) for r in intel) / len(intel)
-
-        actions = ["advance", "flank", "hold", "retreat"]
-        scores = {a: self._score_action(a, terrain_bonus) for a in actions}
-        goal = max(scores, key=scores.get)
+        goal = self._best_action()
 
         for army in self.get_armies():
             if getattr(army, "goal", None) != goal:
@@ -1,10 +1,12 @@
 """Nation node representing a faction in the war simulation."""
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import List, Set, Tuple
 
 from core.simnode import SimNode
 from core.plugins import register_node_type
+from nodes.army import ArmyNode
+from nodes.general import GeneralNode
 
 
 class NationNode(SimNode):
@@ -18,6 +20,19 @@ class NationNode(SimNode):
         ``[x, y]`` coordinates of the nation's capital.
     """
 
+    __slots__ = (
+        "morale",
+        "capital_position",
+        "city_influence_radius",
+        "cities_positions",
+        "_cities_set",
+        "_pending_morale_delta",
+        "_morale_before",
+    )
+
+    # Node types that may (transitively) contain armies.
+    _ARMY_CONTAINERS = (GeneralNode,)
+
     def __init__(
         self, morale: int, capital_position: List[int], **kwargs
     ) -> None:
@@ -29,19 +44,71 @@ class NationNode(SimNode):
         self.cities_positions: List[Tuple[float, float]] = [
             (float(capital_position[0]), float(capital_position[1]))
         ]
+        # Mirror of ``cities_positions`` for O(1) containment checks.
+        self._cities_set: Set[Tuple[float, float]] = set(self.cities_positions)
+        # Morale changes accumulated since the last ``moral_changed`` event.
+        self._pending_morale_delta = 0
+        self._morale_before: int | None = None
+
+    # ------------------------------------------------------------------
+    def add_city(self, x: float, y: float) -> bool:
+        """Record a city at ``(x, y)``.
+
+        Returns ``False`` without changing anything if a city already exists
+        at that position.
+        """
+
+        pos = (x, y)
+        if pos in self._cities_set:
+            return False
+        self._cities_set.add(pos)
+        self.cities_positions.append(pos)
+        return True
+
+    # ------------------------------------------------------------------
+    def has_city(self, x: float, y: float) -> bool:
+        """Return ``True`` if a city was recorded at ``(x, y)``."""
+
+        return (x, y) in self._cities_set
 
     # ------------------------------------------------------------------
     def change_morale(self, delta: int) -> None:
-        """Adjust morale by *delta* and emit ``moral_changed``."""
+        """Adjust morale by *delta*.
 
-        previous = self.morale
+        The change applies immediately but ``moral_changed`` is emitted once
+        per tick with the accumulated delta, see :meth:`flush_morale`.
+        """
+
+        if self._morale_before is None:
+            self._morale_before = self.morale
         self.morale += delta
+        self._pending_morale_delta += delta
+
+    # ------------------------------------------------------------------
+    def flush_morale(self) -> None:
+        """Emit one ``moral_changed`` event for all pending morale changes."""
+
+        previous = self._morale_before
+        if previous is None:
+            return
+        delta = self._pending_morale_delta
+        self._morale_before = None
+        self._pending_morale_delta = 0
+        if delta == 0:
+            return
         self.emit(
             "moral_changed",
             {"previous": previous, "morale": self.morale, "delta": delta},
             direction="down",
         )
 
+    # ------------------------------------------------------------------
+    def update(self, dt: float) -> None:
+        """Update children then publish the tick's morale change."""
+
+        super().update(dt)
+        self.flush_morale()
+
     # ------------------------------------------------------------------
     def capture_capital(self) -> None:
         """Emit ``capital_captured`` for this nation's capital."""
@@ -54,21 +121,35 @@ class NationNode(SimNode):
 
     # ------------------------------------------------------------------
     def get_generals(self) -> List[SimNode]:
-        """Return direct child nodes considered generals."""
+        """Return direct children that are :class:`GeneralNode` instances.
 
-        return [c for c in self.children if c.__class__.__name__ == "GeneralNode"]
+        Children match by exact class, so unrelated classes that merely share
+        the name ``GeneralNode`` are not reported.
+        """
+
+        return self.get_children_of_type(GeneralNode)
 
     # ------------------------------------------------------------------
     def get_armies(self) -> List[SimNode]:
-        """Return all descendant nodes considered armies."""
+        """Return armies commanded by this nation.
+
+        Armies are collected from the nation itself and, recursively, from
+        the node types listed in ``_ARMY_CONTAINERS``; other subtrees (units,
+        transforms, strategists...) cannot hold armies and are skipped. As in
+        :meth:`get_generals`, nodes match by exact class, not by class name.
+        """
 
         armies: List[SimNode] = []
-        stack = list(self.children)
-        while stack:
-            node = stack.pop()
-            if node.__class__.__name__ == "ArmyNode":
-                armies.append(node)
-            stack.extend(node.children)
+        containers = self._ARMY_CONTAINERS
+        level: List[SimNode] = [self]
+        while level:
+            next_level: List[SimNode] = []
+            for node in level:
+                by_type = node._children_by_type
+                armies.extend(by_type.get(ArmyNode, ()))
+                for container in containers:
+                    next_level.extend(by_type.get(container, ()))
+            level = next_level
         return armies
 
 
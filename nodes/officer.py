@@ -5,13 +5,18 @@ from typing import Dict, List
 
 from core.simnode import SimNode
 from core.plugins import register_node_type
+from nodes.unit import UnitNode
 
 
 class OfficerNode(SimNode):
     """Command-level node grouping multiple units."""
 
+    __slots__ = ("_fwd_fields",)
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
+        # Fields stamped onto every forwarded order.
+        self._fwd_fields = {"issuer_id": id(self), "recipient_group": "units"}
         self.on_event("order_received", self._on_order_received)
 
     # ------------------------------------------------------------------
@@ -19,16 +24,17 @@ class OfficerNode(SimNode):
         """Acknowledge and forward orders to subordinate units."""
 
         self.emit("order_ack", {"order": payload}, direction="up")
-        fwd = dict(payload)
-        fwd["issuer_id"] = id(self)
-        fwd["recipient_group"] = "units"
-        fwd.pop("recipient", None)
+        # Listeners may keep the payload they receive, so each order still
+        # gets its own dict; it is built in a single merge.
+        fwd = {**payload, **self._fwd_fields}
+        if "recipient" in fwd:
+            del fwd["recipient"]
         self.emit("order_issued", fwd, direction="up")
 
     # ------------------------------------------------------------------
     def get_units(self) -> List[SimNode]:
         """Return direct child nodes considered units."""
-        return [c for c in self.children if c.__class__.__name__ == "UnitNode"]
+        return self.get_children_of_type(UnitNode)
 
 
 register_node_type("OfficerNode", OfficerNode)
@@ -1,10 +1,17 @@
 """Resource node representing a stockpile of materials."""
 from __future__ import annotations
 
+import sys
+
 from core.simnode import SimNode
 from core.plugins import register_node_type
 
 
+# Capacity ``add`` clamps against for stockpiles created without a
+# ``max_quantity``.
+UNBOUNDED = sys.maxsize
+
+
 class ResourceNode(SimNode):
     """Track the quantity of a single resource type.
 
@@ -15,32 +22,42 @@ class ResourceNode(SimNode):
     quantity:
         Current amount of the resource.
     max_quantity:
-        Maximum capacity for the resource.
+        Maximum capacity for the resource. ``0`` means unbounded.
     """
 
+    __slots__ = ("kind", "quantity", "max_quantity", "_capacity")
+
+    # Derived from ``max_quantity`` in ``__init__``; never serialised.
+    _TRANSIENT_ATTRS = SimNode._TRANSIENT_ATTRS | {"_capacity"}
+
     def __init__(self, kind: str, quantity: int = 0, max_quantity: int = 0, **kwargs) -> None:
         super().__init__(**kwargs)
         self.kind = kind
         self.quantity = quantity
         self.max_quantity = max_quantity
+        # Unbounded stockpiles get a huge finite cap so ``add`` needs no branch.
+        self._capacity = max_quantity or UNBOUNDED
 
     # ------------------------------------------------------------------
     def add(self, amount: int) -> int:
-        """Add ``amount`` to the stockpile and return the added amount."""
+        """Add ``amount`` to the stockpile and return the added amount.
+
+        ``amount`` must be non-negative; callers validate it.
+        """
 
-        if amount < 0:
-            raise ValueError("amount must be non-negative")
-        space = self.max_quantity - self.quantity
-        added = min(space, amount) if self.max_quantity else amount
+        assert amount >= 0, "amount must be non-negative"
+        added = min(self._capacity - self.quantity, amount)
         self.quantity += added
         return added
 
     # ------------------------------------------------------------------
     def remove(self, amount: int) -> int:
-        """Remove up to ``amount`` from the stockpile and return removed."""
+        """Remove up to ``amount`` from the stockpile and return removed.
+
+        ``amount`` must be non-negative; callers validate it.
+        """
 
-        if amount < 0:
-            raise ValueError("amount must be non-negative")
+        assert amount >= 0, "amount must be non-negative"
         removed = min(self.quantity, amount)
         self.quantity -= removed
         return removed
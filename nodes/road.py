@@ -0,0 +1,71 @@
+"""Road layer storing road tiles as plain coordinate arrays."""
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator, Tuple
+
+from core.simnode import SimNode
+from core.plugins import register_node_type
+
+
+class RoadLayerNode(SimNode):
+    """Hold every road tile of the world in two parallel integer arrays.
+
+    Roads carry no state besides their tile coordinates, so instead of one
+    ``BuildingNode`` + ``TransformNode`` pair per tile the coordinates are
+    appended to ``xs``/``ys``.
+
+    Parameters
+    ----------
+    xs, ys:
+        Optional initial tile coordinates.
+    """
+
+    def __init__(
+        self, xs: Iterable[int] = (), ys: Iterable[int] = (), **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+        self.xs = array("i", xs)
+        self.ys = array("i", ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError("xs and ys must have the same length")
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    # ------------------------------------------------------------------
+    def add_tile(self, x: int, y: int) -> None:
+        """Append the road tile ``(x, y)``."""
+
+        self.xs.append(x)
+        self.ys.append(y)
+
+    # ------------------------------------------------------------------
+    def add_tiles(self, tiles: Iterable[Tuple[int, int]]) -> None:
+        """Append all ``(x, y)`` pairs from *tiles*."""
+
+        xs = self.xs
+        ys = self.ys
+        for x, y in tiles:
+            xs.append(x)
+            ys.append(y)
+
+    # ------------------------------------------------------------------
+    def tiles(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over stored road tiles as ``(x, y)`` tuples."""
+
+        return zip(self.xs, self.ys)
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def for_root(cls, root: SimNode) -> "RoadLayerNode":
+        """Return the road layer attached to *root*, creating it if needed."""
+
+        layer = root.get_child_of_type(cls)
+        if layer is None:
+            layer = cls(parent=root, name="roads")
+        return layer
+
+
+register_node_type("RoadLayerNode", RoadLayerNode)
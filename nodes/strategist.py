@@ -1,33 +1,85 @@
 """Strategist node collecting reconnaissance intel."""
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from typing import Dict, List
 
 from core.simnode import SimNode
 from core.plugins import register_node_type
 
 
+# Default intel capacity, so long runs keep a bounded report list.
+DEFAULT_MAX_REPORTS = 1000
+
+
 class StrategistNode(SimNode):
-    """Collect and provide reconnaissance intel for the general."""
+    """Collect and provide reconnaissance intel for the general.
+
+    Parameters
+    ----------
+    max_reports:
+        Maximum number of reports kept, :data:`DEFAULT_MAX_REPORTS` by
+        default. Once full, each new report evicts the oldest one. ``None``
+        keeps every report.
+    intel_ttl_s:
+        Optional lifetime in seconds. Reports older than the newest report
+        by more than this are evicted when new intel arrives.
+    """
+
+    __slots__ = ("intel_reports", "_intel_timestamps", "max_reports", "intel_ttl_s")
 
-    def __init__(self, **kwargs) -> None:
+    def __init__(
+        self,
+        max_reports: int | None = DEFAULT_MAX_REPORTS,
+        intel_ttl_s: float | None = None,
+        **kwargs,
+    ) -> None:
         super().__init__(**kwargs)
+        self.max_reports = max_reports
+        self.intel_ttl_s = intel_ttl_s
+        # Reports ordered by timestamp, with the timestamps mirrored in
+        # ``_intel_timestamps`` so age windows can be found by bisection.
         self.intel_reports: List[Dict] = []
+        self._intel_timestamps: List[float] = []
         # Listen to intel events produced by the visibility system
         self.on_event("enemy_spotted", self._record_intel)
 
     # ------------------------------------------------------------------
     def _record_intel(self, _origin: SimNode, _event: str, payload: Dict) -> None:
         """Store an intel report."""
-        self.intel_reports.append(payload)
+        ts = payload.get("timestamp", 0)
+        timestamps = self._intel_timestamps
+        if not timestamps or ts >= timestamps[-1]:
+            timestamps.append(ts)
+            self.intel_reports.append(payload)
+        else:
+            i = bisect_right(timestamps, ts)
+            timestamps.insert(i, ts)
+            self.intel_reports.insert(i, payload)
+        self._evict()
+
+    # ------------------------------------------------------------------
+    def _evict(self) -> None:
+        """Drop reports beyond ``max_reports`` or older than ``intel_ttl_s``."""
+        timestamps = self._intel_timestamps
+        drop = 0 if self.max_reports is None else len(timestamps) - self.max_reports
+        if self.intel_ttl_s is not None:
+            drop = max(drop, bisect_left(timestamps, timestamps[-1] - self.intel_ttl_s))
+        if drop > 0:
+            del timestamps[:drop]
+            del self.intel_reports[:drop]
 
     # ------------------------------------------------------------------
     def get_enemy_estimates(self, max_age_s: float = 60.0) -> List[Dict]:
-        """Return recent intel reports not older than *max_age_s* seconds."""
-        if not self.intel_reports:
+        """Return recent intel reports not older than *max_age_s* seconds.
+
+        Age is measured relative to the newest report.
+        """
+        timestamps = self._intel_timestamps
+        if not timestamps:
             return []
-        now = max(r.get("timestamp", 0) for r in self.intel_reports)
-        return [r for r in self.intel_reports if now - r.get("timestamp", 0) <= max_age_s]
+        start = bisect_left(timestamps, timestamps[-1] - max_age_s)
+        return self.intel_reports[start:]
 
 
 register_node_type("StrategistNode", StrategistNode)
@@ -1,13 +1,70 @@
 """Terrain node defining map tiles and modifiers."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from array import array
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from core.simnode import SimNode
 from core.plugins import register_node_type
 from core.terrain import TILE_CODES, TILE_NAMES
 
 
+# Neighbour offsets for square (N, S, E, W) and hexagonal axial grids.
+_SQUARE_OFFSETS: Tuple[Tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_HEX_OFFSETS: Tuple[Tuple[int, int], ...] = (
+    (1, 0),
+    (1, -1),
+    (0, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, 1),
+)
+
+
+# Terrain name per tile code (``None`` for unused codes) indexed directly by
+# the byte value stored in the grid.
+_NAME_LUT: Tuple[str | None, ...] = tuple(TILE_NAMES.get(code) for code in range(256))
+
+
+_GRID_TYPES = frozenset(("square", "hex"))
+
+# Default modifiers keyed by terrain name. They are only read (the
+# per-instance lookup tables are built from them), so every terrain without
+# overrides shares these mappings.
+_DEFAULT_SPEED: Mapping[str, float] = MappingProxyType(
+    {
+        "plain": 1.0,
+        "forest": 0.7,
+        "hill": 0.9,
+        "water": 0.4,
+        "mountain": 0.6,
+        "swamp": 0.5,
+        "desert": 0.8,
+        "road": 1.0,
+    }
+)
+_DEFAULT_COMBAT: Mapping[str, int] = MappingProxyType(
+    {
+        "plain": 0,
+        "forest": 1,
+        "hill": 2,
+        "water": -2,
+        "mountain": 3,
+        "swamp": -1,
+        "desert": 0,
+        "road": 0,
+    }
+)
+
+
+def _tile_code(key: str | int) -> int:
+    """Return the tile code for a terrain name or an existing code."""
+
+    return TILE_CODES[key] if isinstance(key, str) else int(key)
+
+
 class TerrainNode(SimNode):
     """Store terrain tiles and provide movement/combat modifiers.
 
@@ -28,6 +85,47 @@ class TerrainNode(SimNode):
         mountains.
     """
 
+    __slots__ = (
+        "_grid",
+        "_rows",
+        "width",
+        "height",
+        "_obstacles",
+        "_obstacle_mask",
+        "_speed_modifiers",
+        "_combat_bonuses",
+        "_speed_lut",
+        "_combat_lut",
+        "_step_costs",
+        "grid_type",
+        "_offsets",
+        "_altitude",
+        "_altitude_rows",
+        "_altitude_width",
+        "_altitude_height",
+        "params",
+        "_version",
+    )
+
+    # Slots rebuilt from constructor arguments; :meth:`serialize` stores the
+    # public constructor arguments instead.
+    _TRANSIENT_ATTRS = SimNode._TRANSIENT_ATTRS | {
+        "_grid",
+        "_rows",
+        "_obstacles",
+        "_obstacle_mask",
+        "_speed_modifiers",
+        "_combat_bonuses",
+        "_speed_lut",
+        "_combat_lut",
+        "_step_costs",
+        "_altitude",
+        "_altitude_rows",
+        "_altitude_width",
+        "_altitude_height",
+        "_version",
+    }
+
     def __init__(
         self,
         tiles: List[List[int]] | List[List[str]],
@@ -40,97 +138,390 @@ class TerrainNode(SimNode):
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
-        # Convert any string based grid to byte codes
-        if tiles and isinstance(tiles[0][0], str):
-            self.tiles: List[bytearray] = [
-                bytearray(TILE_CODES[t] for t in row) for row in tiles
-            ]
-        else:
-            self.tiles = [bytearray(row) for row in tiles]
-        self.height = len(self.tiles)
-        self.width = len(self.tiles[0]) if self.tiles else 0
-        default_speed = {
-            "plain": 1.0,
-            "forest": 0.7,
-            "hill": 0.9,
-            "water": 0.4,
-            "mountain": 0.6,
-            "swamp": 0.5,
-            "desert": 0.8,
-            "road": 1.0,
-        }
-        default_combat = {
-            "plain": 0,
-            "forest": 1,
-            "hill": 2,
-            "water": -2,
-            "mountain": 3,
-            "swamp": -1,
-            "desert": 0,
-            "road": 0,
-        }
-        sm = speed_modifiers or default_speed
-        cb = combat_bonuses or default_combat
-        self.speed_modifiers = {TILE_CODES[k]: v for k, v in sm.items()}
-        self.combat_bonuses = {TILE_CODES[k]: v for k, v in cb.items()}
+        self._version = 0
+        self.tiles = tiles
+        sm = speed_modifiers or _DEFAULT_SPEED
+        cb = combat_bonuses or _DEFAULT_COMBAT
+        self._speed_modifiers: Dict[int, float] = {}
+        self._combat_bonuses: Dict[int, int] = {}
+        self.update_modifiers(speed=sm, combat=cb)
         self.grid_type = grid_type
-        if self.grid_type not in {"square", "hex"}:
+        if self.grid_type not in _GRID_TYPES:
             raise ValueError("grid_type must be 'square' or 'hex'")
-        self.obstacles = {tuple(o) for o in (obstacles or [])}
+        self._offsets = _SQUARE_OFFSETS if grid_type == "square" else _HEX_OFFSETS
+        self.obstacles = obstacles or ()
         self.altitude_map = altitude_map
         self.params = terrain_params or {}
 
+    # ------------------------------------------------------------------
+    @property
+    def tiles(self) -> List[memoryview]:
+        """Rows of tile codes.
+
+        The codes are stored row-major in one contiguous ``bytearray``; each
+        row is a read-only ``memoryview`` slice of it, so ``tiles[y][x]``
+        keeps working while single-tile and batch queries index the flat
+        buffer. Change tiles through this setter, :meth:`set_tile_bytes` or
+        :meth:`set_tile` so :attr:`version` stays accurate.
+        """
+
+        return self._rows
+
+    @tiles.setter
+    def tiles(self, rows: Sequence[Sequence[int]] | Sequence[Sequence[str]]) -> None:
+        # Convert any string based grid to byte codes
+        if rows and len(rows[0]) and isinstance(rows[0][0], str):
+            rows = [bytes(TILE_CODES[t] for t in row) for row in rows]
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+        grid = bytearray()
+        for row in rows:
+            if len(row) != width:
+                raise ValueError("all terrain rows must have the same length")
+            grid += bytes(row)
+        self._install_grid(grid, width, height)
+
+    # ------------------------------------------------------------------
+    def set_tile_bytes(self, codes: bytes | bytearray | memoryview, width: int) -> None:
+        """Replace all tiles with row-major ``codes`` of the given ``width``.
+
+        This is the inverse of :meth:`tile_bytes` and avoids building one
+        object per row, e.g. when loading a cached terrain.
+        """
+
+        grid = bytearray(codes)
+        if width <= 0 or len(grid) % width:
+            raise ValueError("tile buffer size must be a multiple of width")
+        self._install_grid(grid, width, len(grid) // width)
+
+    # ------------------------------------------------------------------
+    def tile_bytes(self) -> bytes:
+        """Return a copy of all tile codes in row-major order."""
+
+        return bytes(self._grid)
+
+    # ------------------------------------------------------------------
+    def _install_grid(self, grid: bytearray, width: int, height: int) -> None:
+        view = memoryview(grid).toreadonly()
+        self._grid = grid
+        self._rows = [view[y * width : (y + 1) * width] for y in range(height)]
+        self.height = height
+        self.width = width
+        self._version += 1
+        self._rebuild_obstacle_mask()
+
+    # ------------------------------------------------------------------
+    def set_tile(self, x: int, y: int, tile: str | int) -> None:
+        """Change the terrain at ``(x, y)`` to ``tile`` (name or code).
+
+        Bumps :attr:`version` and emits ``terrain_dirty`` with the changed
+        coordinates so caches derived from the tiles can refresh.
+        """
+
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise IndexError(f"tile ({x}, {y}) is outside the terrain")
+        self._grid[y * self.width + x] = _tile_code(tile)
+        self._version += 1
+        self.emit("terrain_dirty", {"x": x, "y": y})
+
+    # ------------------------------------------------------------------
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever any tile changes."""
+
+        return self._version
+
+    # ------------------------------------------------------------------
+    @property
+    def obstacles(self) -> FrozenSet[Tuple[int, int]]:
+        """Impassable ``(x, y)`` coordinates.
+
+        Assign a new collection to change them; in-bounds entries are mirrored
+        in a one-byte-per-tile mask used by :meth:`is_obstacle`.
+        """
+
+        return self._obstacles
+
+    @obstacles.setter
+    def obstacles(self, obstacles: Iterable[Sequence[int]]) -> None:
+        self._obstacles = frozenset(tuple(o) for o in obstacles)
+        self._rebuild_obstacle_mask()
+
+    def _rebuild_obstacle_mask(self) -> None:
+        w = self.width
+        h = self.height
+        mask = bytearray(w * h)
+        for x, y in getattr(self, "_obstacles", ()):
+            if 0 <= x < w and 0 <= y < h:
+                mask[y * w + x] = 1
+        self._obstacle_mask = mask
+
+    # ------------------------------------------------------------------
+    @property
+    def speed_modifiers(self) -> Mapping[int, float]:
+        """Read-only view of speed modifiers keyed by tile code."""
+
+        return MappingProxyType(self._speed_modifiers)
+
+    @speed_modifiers.setter
+    def speed_modifiers(self, modifiers: Mapping[str | int, float]) -> None:
+        self._speed_modifiers = {}
+        self.update_modifiers(speed=modifiers)
+
+    @property
+    def combat_bonuses(self) -> Mapping[int, int]:
+        """Read-only view of combat bonuses keyed by tile code."""
+
+        return MappingProxyType(self._combat_bonuses)
+
+    @combat_bonuses.setter
+    def combat_bonuses(self, bonuses: Mapping[str | int, int]) -> None:
+        self._combat_bonuses = {}
+        self.update_modifiers(combat=bonuses)
+
+    # ------------------------------------------------------------------
+    @property
+    def altitude_map(self) -> List[memoryview] | None:
+        """Rows of altitude values or ``None`` without an altitude map.
+
+        Values are stored row-major in one ``array('d')``, so they read back
+        exactly as assigned; rows are ``memoryview`` slices of it. Assigning a
+        map with the same dimensions rewrites that buffer in place, so
+        previously returned rows see the new values.
+        """
+
+        return self._altitude_rows
+
+    @altitude_map.setter
+    def altitude_map(self, rows: Sequence[Sequence[float]] | None) -> None:
+        if rows is None:
+            self._altitude = None
+            self._altitude_rows = None
+            self._altitude_width = self._altitude_height = 0
+            return
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("all altitude rows must have the same length")
+        flat = getattr(self, "_altitude", None)
+        if (
+            flat is not None
+            and self._altitude_width == width
+            and self._altitude_height == height
+        ):
+            # Same shape as the current map: overwrite the buffer in place
+            # so regenerations do not reallocate it or its row views.
+            for i, value in enumerate(chain.from_iterable(rows)):
+                flat[i] = value
+            return
+        flat = array("d")
+        for row in rows:
+            flat.extend(row)
+        view = memoryview(flat)
+        self._altitude = flat
+        self._altitude_rows = [view[y * width : (y + 1) * width] for y in range(height)]
+        self._altitude_width = width
+        self._altitude_height = height
+
+    # ------------------------------------------------------------------
+    def update_modifiers(
+        self,
+        speed: Optional[Mapping[str | int, float]] = None,
+        combat: Optional[Mapping[str | int, int]] = None,
+    ) -> None:
+        """Merge *speed* and *combat* values keyed by terrain name or code.
+
+        The 256-entry lookup tables indexed by tile code are rebuilt so
+        modifier queries are a single list index, along with the step-cost
+        table handed out by :meth:`path_grid`.
+        """
+
+        if speed:
+            for key, value in speed.items():
+                self._speed_modifiers[_tile_code(key)] = value
+        if combat:
+            for key, value in combat.items():
+                self._combat_bonuses[_tile_code(key)] = value
+        speed_lut = [1.0] * 256
+        for code, value in self._speed_modifiers.items():
+            speed_lut[code] = value
+        combat_lut = [0] * 256
+        for code, value in self._combat_bonuses.items():
+            combat_lut[code] = value
+        self._speed_lut = speed_lut
+        self._combat_lut = combat_lut
+        # Cost of entering a tile per code; zero speed makes it unreachable.
+        inf = float("inf")
+        self._step_costs = tuple(1.0 / speed if speed else inf for speed in speed_lut)
+
+    # ------------------------------------------------------------------
+    def path_grid(
+        self,
+    ) -> Tuple[memoryview, memoryview, Tuple[Tuple[int, int], ...], Tuple[float, ...]]:
+        """Return ``(codes, obstacle_mask, offsets, step_costs)`` for search.
+
+        ``codes`` and ``obstacle_mask`` are read-only row-major views with one
+        byte per tile (index ``y * width + x``), ``offsets`` are the neighbour
+        offsets of the grid type and ``step_costs`` maps a tile code to the
+        cost of entering it (``1 / speed``, infinite for zero speed). The
+        cost table is cached and only rebuilt by :meth:`update_modifiers`.
+        Reassigning tiles, obstacles or modifiers replaces these buffers, so
+        fetch the tuple once per search rather than keeping it.
+        """
+
+        return (
+            memoryview(self._grid).toreadonly(),
+            memoryview(self._obstacle_mask).toreadonly(),
+            self._offsets,
+            self._step_costs,
+        )
+
+    # ------------------------------------------------------------------
+    def serialize(self) -> Dict[str, Any]:
+        data = super().serialize()
+        state = data["state"]
+        state["tiles"] = [bytes(row) for row in self._rows]
+        state["obstacles"] = [list(o) for o in self._obstacles]
+        rows = self._altitude_rows
+        state["altitude_map"] = [row.tolist() for row in rows] if rows is not None else None
+        state["speed_modifiers"] = {
+            TILE_NAMES[c]: v for c, v in self._speed_modifiers.items()
+        }
+        state["combat_bonuses"] = {
+            TILE_NAMES[c]: v for c, v in self._combat_bonuses.items()
+        }
+        return data
+
     # ------------------------------------------------------------------
     def get_tile_code(self, x: int, y: int) -> int | None:
         """Return the terrain code at ``(x, y)`` or ``None`` if out of bounds."""
 
-        if 0 <= y < self.height and 0 <= x < self.width:
-            return self.tiles[y][x]
+        w = self.width
+        if 0 <= x < w and 0 <= y < self.height:
+            return self._grid[y * w + x]
         return None
 
+    # ------------------------------------------------------------------
+    def get_tile_codes(self, xs: Iterable[int], ys: Iterable[int]) -> List[int | None]:
+        """Return the terrain codes for each ``(xs[i], ys[i])`` pair."""
+
+        grid = self._grid
+        w = self.width
+        h = self.height
+        return [
+            grid[y * w + x] if 0 <= y < h and 0 <= x < w else None
+            for x, y in zip(xs, ys)
+        ]
+
     # ------------------------------------------------------------------
     def get_tile(self, x: int, y: int) -> str | None:
         """Return the terrain name at ``(x, y)`` or ``None`` if out of bounds."""
 
-        code = self.get_tile_code(x, y)
-        if code is None:
-            return None
-        return TILE_NAMES.get(code)
+        w = self.width
+        if 0 <= x < w and 0 <= y < self.height:
+            return _NAME_LUT[self._grid[y * w + x]]
+        return None
+
+    # ------------------------------------------------------------------
+    def get_tile_unchecked(self, x: int, y: int) -> str | None:
+        """Return the terrain name at ``(x, y)`` without a bounds check.
+
+        Callers must guarantee ``0 <= x < width`` and ``0 <= y < height``,
+        e.g. for coordinates produced by :meth:`get_neighbors`.
+        """
+
+        return _NAME_LUT[self._grid[y * self.width + x]]
 
     # ------------------------------------------------------------------
     def get_speed_modifier(self, x: int, y: int) -> float:
         """Return movement speed modifier for tile at ``(x, y)``."""
 
-        code = self.get_tile_code(x, y)
-        if code is None:
-            return 1.0
-        return self.speed_modifiers.get(code, 1.0)
+        w = self.width
+        if 0 <= x < w and 0 <= y < self.height:
+            return self._speed_lut[self._grid[y * w + x]]
+        return 1.0
+
+    # ------------------------------------------------------------------
+    def get_speed_modifiers(self, xs: Iterable[int], ys: Iterable[int]) -> List[float]:
+        """Return movement speed modifiers for each ``(xs[i], ys[i])`` pair.
+
+        Out of bounds coordinates yield ``1.0`` like
+        :meth:`get_speed_modifier`.
+        """
+
+        grid = self._grid
+        w = self.width
+        h = self.height
+        lut = self._speed_lut
+        return [
+            lut[grid[y * w + x]] if 0 <= y < h and 0 <= x < w else 1.0
+            for x, y in zip(xs, ys)
+        ]
 
     # ------------------------------------------------------------------
     def get_combat_bonus(self, x: int, y: int) -> int:
         """Return combat bonus for tile at ``(x, y)``."""
 
-        code = self.get_tile_code(x, y)
-        if code is None:
-            return 0
-        return self.combat_bonuses.get(code, 0)
+        w = self.width
+        if 0 <= x < w and 0 <= y < self.height:
+            return self._combat_lut[self._grid[y * w + x]]
+        return 0
+
+    # ------------------------------------------------------------------
+    def get_combat_bonuses(self, xs: Iterable[int], ys: Iterable[int]) -> List[int]:
+        """Return combat bonuses for each ``(xs[i], ys[i])`` pair.
+
+        Out of bounds coordinates yield ``0`` like :meth:`get_combat_bonus`.
+        """
+
+        grid = self._grid
+        w = self.width
+        h = self.height
+        lut = self._combat_lut
+        return [
+            lut[grid[y * w + x]] if 0 <= y < h and 0 <= x < w else 0
+            for x, y in zip(xs, ys)
+        ]
 
     # ------------------------------------------------------------------
     def is_obstacle(self, x: int, y: int) -> bool:
         """Return ``True`` if ``(x, y)`` is marked as an obstacle."""
 
-        return (x, y) in self.obstacles
+        w = self.width
+        if 0 <= x < w and 0 <= y < self.height:
+            return self._obstacle_mask[y * w + x] == 1
+        return (x, y) in self._obstacles
 
     # ------------------------------------------------------------------
     def get_altitude(self, x: int, y: int) -> float | None:
         """Return altitude value at ``(x, y)`` if an altitude map exists."""
 
-        if self.altitude_map is None:
+        if self._altitude is None:
             return None
-        if 0 <= y < len(self.altitude_map) and 0 <= x < len(self.altitude_map[0]):
-            return self.altitude_map[y][x]
+        w = self._altitude_width
+        if 0 <= y < self._altitude_height and 0 <= x < w:
+            return self._altitude[y * w + x]
         return None
 
+    # ------------------------------------------------------------------
+    def get_altitudes(
+        self, xs: Iterable[int], ys: Iterable[int]
+    ) -> List[float | None]:
+        """Return altitudes for each ``(xs[i], ys[i])`` pair.
+
+        Entries are ``None`` outside the altitude map or when there is none.
+        """
+
+        alt = self._altitude
+        if alt is None:
+            return [None for _ in zip(xs, ys)]
+        w = self._altitude_width
+        h = self._altitude_height
+        return [
+            alt[y * w + x] if 0 <= y < h and 0 <= x < w else None
+            for x, y in zip(xs, ys)
+        ]
+
     # ------------------------------------------------------------------
     def get_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
         """Return neighbouring coordinates for the given tile.
@@ -140,16 +531,25 @@ class TerrainNode(SimNode):
         axial coordinate system.
         """
 
-        if self.grid_type == "square":
-            offsets = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-        else:  # hex grid
-            offsets = [(1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)]
-        neighbors: List[Tuple[int, int]] = []
-        for dx, dy in offsets:
-            nx, ny = x + dx, y + dy
-            if 0 <= ny < self.height and 0 <= nx < self.width:
-                neighbors.append((nx, ny))
-        return neighbors
+        w = self.width
+        h = self.height
+        return [
+            (x + dx, y + dy)
+            for dx, dy in self._offsets
+            if 0 <= x + dx < w and 0 <= y + dy < h
+        ]
+
+    # ------------------------------------------------------------------
+    def iter_neighbors(self, x: int, y: int) -> Iterator[Tuple[int, int]]:
+        """Yield the coordinates returned by :meth:`get_neighbors` lazily."""
+
+        w = self.width
+        h = self.height
+        for dx, dy in self._offsets:
+            nx = x + dx
+            ny = y + dy
+            if 0 <= nx < w and 0 <= ny < h:
+                yield nx, ny
 
 
 register_node_type("TerrainNode", TerrainNode)
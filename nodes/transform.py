@@ -18,6 +18,8 @@ class TransformNode(SimNode):
         Initial velocity in meters per second. Defaults to ``[0.0, 0.0]``.
     """
 
+    __slots__ = ("position", "velocity")
+
     def __init__(
         self,
         position: List[float] | None = None,
@@ -30,8 +32,13 @@ class TransformNode(SimNode):
 
     def update(self, dt: float) -> None:  # pragma: no cover - simple integration
         """Advance position based on velocity."""
-        self.position[0] += self.velocity[0] * dt
-        self.position[1] += self.velocity[1] * dt
+        vx, vy = self.velocity
+        # Most transforms are stationary (movement writes positions
+        # directly), so skip the integration when there is nothing to add.
+        if vx or vy:
+            position = self.position
+            position[0] += vx * dt
+            position[1] += vy * dt
         super().update(dt)
 
 
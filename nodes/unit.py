@@ -5,6 +5,7 @@ from typing import Dict
 
 from core.simnode import SimNode
 from core.plugins import register_node_type
+from nodes.nation import NationNode
 
 
 class UnitNode(SimNode):
@@ -29,6 +30,25 @@ class UnitNode(SimNode):
         Vision radius in meters used by the visibility system.
     """
 
+    __slots__ = (
+        "size",
+        "state",
+        "speed",
+        "morale",
+        "target",
+        "retreat_threshold",
+        "vision_radius_m",
+        "current_order",
+        # Set by MovementSystem while following a path or wandering.
+        "_path",
+        "_wander_angle",
+        "_home_nation",
+        "_home_nation_version",
+    )
+
+    # The cached owning nation is rebuilt on demand and never serialised.
+    _TRANSIENT_ATTRS = SimNode._TRANSIENT_ATTRS | {"_home_nation", "_home_nation_version"}
+
     def __init__(
         self,
         size: int = 100,
@@ -49,6 +69,10 @@ class UnitNode(SimNode):
         self.retreat_threshold = retreat_threshold
         self.vision_radius_m = vision_radius_m
         self.current_order: Dict | None = None
+        # Owning nation, reused until the tree structure changes (see
+        # :attr:`SimNode._structure_version`).
+        self._home_nation: NationNode | None = None
+        self._home_nation_version = -1
         self.on_event("order_received", self._on_order_received)
 
     # ------------------------------------------------------------------
@@ -92,12 +116,18 @@ class UnitNode(SimNode):
     def _get_home_position(self) -> list[int] | None:
         """Return the capital position of the owning nation if available."""
 
-        cur = self.parent
-        while cur is not None:
-            if cur.__class__.__name__ == "NationNode":
-                return getattr(cur, "capital_position", None)
-            cur = cur.parent
-        return None
+        version = SimNode._structure_version
+        if self._home_nation_version == version:
+            nation = self._home_nation
+        else:
+            nation = self.parent
+            while nation is not None and not isinstance(nation, NationNode):
+                nation = nation.parent
+            self._home_nation = nation
+            self._home_nation_version = version
+        if nation is None:
+            return None
+        return nation.capital_position
 
     # ------------------------------------------------------------------
     def update(self, dt: float) -> None:
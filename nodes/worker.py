@@ -1,6 +1,8 @@
 """Worker unit node updated at intervals by the scheduler."""
 from __future__ import annotations
 
+from typing import Dict, Set, Tuple
+
 from core.plugins import register_node_type
 from core.simnode import SimNode
 from nodes.unit import UnitNode
@@ -19,9 +21,31 @@ class WorkerNode(UnitNode):
         Seconds between updates when scheduled.
     """
 
+    __slots__ = ("update_interval", "_root_cache", "_root_cache_version", "_system_cache")
+
+    # Worker state entered for each accepted task name; others mean idle.
+    _TASK_STATES = {
+        "gather": "gathering",
+        "gathering": "gathering",
+        "build": "building",
+        "building": "building",
+    }
+
+    # Lookup caches are rebuilt on demand and never serialised.
+    _TRANSIENT_ATTRS = UnitNode._TRANSIENT_ATTRS | {
+        "_root_cache",
+        "_root_cache_version",
+        "_system_cache",
+    }
+
     def __init__(self, update_interval: float = 1.0, **kwargs) -> None:
         super().__init__(**kwargs)
         self.update_interval = update_interval
+        # Cached tree root (valid until any subtree is attached or detached)
+        # and root-level systems keyed by their class.
+        self._root_cache: SimNode | None = None
+        self._root_cache_version = -1
+        self._system_cache: Dict[type, SimNode] = {}
         # Idle workers are not updated automatically until scheduled.
         self._manual_update = True
         self.on_event("task_assigned", self._on_task_assigned)
@@ -30,30 +54,53 @@ class WorkerNode(UnitNode):
         # assign a task.
         self.emit("unit_idle", {}, direction="up")
 
+    # ------------------------------------------------------------------
+    def _find_root(self) -> SimNode:
+        """Return the root of the simulation tree.
+
+        The result is cached until the tree structure changes anywhere (see
+        :attr:`SimNode._structure_version`), which also catches an ancestor
+        being reparented, so repeated lookups between changes are O(1).
+        """
+
+        version = SimNode._structure_version
+        root = self._root_cache
+        if root is not None and self._root_cache_version == version:
+            return root
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        self._root_cache = root
+        self._root_cache_version = version
+        self._system_cache.clear()
+        return root
+
+    # ------------------------------------------------------------------
+    def _find_system(self, cls: type) -> SimNode | None:
+        """Return the first system of type ``cls`` attached to the root."""
+
+        root = self._find_root()
+        system = self._system_cache.get(cls)
+        if system is not None and system.parent is root:
+            return system
+        systems = root._children_by_type.get(cls)
+        if not systems:
+            return None
+        system = self._system_cache[cls] = systems[0]
+        return system
+
     # ------------------------------------------------------------------
     def _find_scheduler(self) -> SchedulerSystem | None:
         """Return the :class:`SchedulerSystem` in the simulation tree."""
 
-        node = self
-        # ascend to root
-        while node.parent is not None:
-            node = node.parent
-        for child in node.children:
-            if isinstance(child, SchedulerSystem):
-                return child
-        return None
+        return self._find_system(SchedulerSystem)
 
     # ------------------------------------------------------------------
     def _on_task_assigned(self, _origin, _event, payload) -> None:
         """Assign task and register with scheduler."""
 
         task = payload.get("task") or payload.get("state")
-        if task in {"gather", "gathering"}:
-            self.state = "gathering"
-        elif task in {"build", "building"}:
-            self.state = "building"
-        else:
-            self.state = "idle"
+        self.state = self._TASK_STATES.get(task, "idle")
         scheduler = self._find_scheduler()
         if scheduler is not None:
             scheduler.unschedule(self)
@@ -76,37 +123,38 @@ class WorkerNode(UnitNode):
     def _find_pathfinder(self) -> PathfindingSystem | None:
         """Return the :class:`PathfindingSystem` in the simulation tree."""
 
-        node = self
-        while node.parent is not None:
-            node = node.parent
-        for child in node.children:
-            if isinstance(child, PathfindingSystem):
-                return child
-        return None
+        return self._find_system(PathfindingSystem)
 
     # ------------------------------------------------------------------
     def _get_transform(self, node: SimNode) -> TransformNode | None:
         if isinstance(node, TransformNode):
             return node
-        for child in node.children:
-            if isinstance(child, TransformNode):
-                return child
-        return None
+        return node.get_child_of_type(TransformNode)
 
     # ------------------------------------------------------------------
     def _iter_resources(self, node: SimNode):
-        for child in node.children:
+        """Yield every :class:`ResourceNode` below ``node`` in depth-first order."""
+
+        # Iterative pre-order walk: children are pushed reversed so they are
+        # visited in the same order as a recursive traversal would.
+        stack = list(reversed(node.children))
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            child = pop()
             if isinstance(child, ResourceNode):
                 yield child
-            yield from self._iter_resources(child)
+            if child.children:
+                push(reversed(child.children))
 
     # ------------------------------------------------------------------
     def find_task(self) -> bool:
         """Assign the worker to the nearest resource or zone.
 
-        The closest accessible :class:`ResourceNode` is selected using the
-        :class:`PathfindingSystem`. If a target is found the worker's ``target``
-        and ``state`` are updated and a ``unit_move`` event is emitted.
+        The closest accessible :class:`ResourceNode` is selected with a single
+        :meth:`PathfindingSystem.find_nearest` search over all resource
+        tiles. If a target is found the worker's ``target`` and ``state`` are
+        updated and a ``unit_move`` event is emitted.
 
         Returns ``True`` if a task was assigned.
         """
@@ -120,32 +168,28 @@ class WorkerNode(UnitNode):
             int(round(transform.position[0])),
             int(round(transform.position[1])),
         )
-        root = self
-        while root.parent is not None:
-            root = root.parent
-
-        nearest = None
-        best_len = float("inf")
-        for res in self._iter_resources(root):
-            r_tr = self._get_transform(res)
-            if r_tr is None:
-                continue
-            goal = (
-                int(round(r_tr.position[0])),
-                int(round(r_tr.position[1])),
-            )
-            path = pathfinder.find_path(start, goal)
-            if path and len(path) < best_len:
-                best_len = len(path)
-                nearest = goal
-
-        if nearest is None:
+        path = pathfinder.find_nearest(start, self._resource_tiles())
+        if not path:
             return False
 
+        nearest = path[-1]
         self.target = [nearest[0], nearest[1]]
         self.state = "moving"
         self.emit("unit_move", {"to": self.target}, direction="up")
         return True
 
+    # ------------------------------------------------------------------
+    def _resource_tiles(self) -> Set[Tuple[int, int]]:
+        """Return the tiles of all resources in the simulation tree."""
+
+        tiles: Set[Tuple[int, int]] = set()
+        for res in self._iter_resources(self._find_root()):
+            r_tr = self._get_transform(res)
+            if r_tr is not None:
+                tiles.add(
+                    (int(round(r_tr.position[0])), int(round(r_tr.position[1])))
+                )
+        return tiles
+
 
 register_node_type("WorkerNode", WorkerNode)
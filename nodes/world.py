@@ -17,10 +17,23 @@ class WorldNode(SimNode):
     height:
         Height of the world map in meters.
     seed:
-        Optional seed for global random number generation to make
-        simulations deterministic.
+        Optional seed for the world's own random stream (:attr:`rng`) to
+        make simulations deterministic.
+
+    Attributes
+    ----------
+    rng:
+        Random stream used by the nodes and systems of this world. Seeded
+        worlds get a private :class:`random.Random`, so several worlds can
+        run side by side without disturbing each other or the global
+        generator; unseeded worlds share the global :mod:`random` stream.
     """
 
+    __slots__ = ("width", "height", "seed", "rng")
+
+    # The stream is rebuilt from ``seed`` and never serialised.
+    _TRANSIENT_ATTRS = SimNode._TRANSIENT_ATTRS | {"rng"}
+
     def __init__(
         self,
         width: int = 100,
@@ -32,8 +45,20 @@ class WorldNode(SimNode):
         self.width = width
         self.height = height
         self.seed = seed
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed) if seed is not None else random
+
+
+def world_rng(node: SimNode):
+    """Return the :attr:`WorldNode.rng` of the world containing *node*.
+
+    Falls back to the global :mod:`random` module when *node* is not part
+    of a :class:`WorldNode` tree.
+    """
+
+    root = node
+    while root.parent is not None:
+        root = root.parent
+    return root.rng if isinstance(root, WorldNode) else random
 
 
 register_node_type("WorldNode", WorldNode)
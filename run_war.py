@@ -5,7 +5,10 @@ import argparse
 import os
 from typing import Any, List
 
-__all__ = ["load_sim_params", "_spawn_armies", "sim_params", "run"]
+__all__ = ["load_sim_params", "_spawn_armies", "sim_params", "run", "TERRAIN_CACHE"]
+
+# Terrain cache file read and written when caching is enabled.
+TERRAIN_CACHE = os.path.join(os.path.dirname(__file__), "terrain_cache.pkl")
 
 def load_sim_params(path: str) -> dict:
     from simulation.war.war_loader import load_sim_params as _load
@@ -16,47 +19,54 @@ def _spawn_armies(*args: Any, **kwargs: Any) -> None:
     return _spawn(*args, **kwargs)
 
 
-class _SimParamsProxy(dict):
-    def _data(self):
+def __getattr__(name: str) -> Any:
+    # ``sim_params`` resolves to the loader's dict itself on first access so
+    # callers index a plain dict; the import stays lazy like the helpers above.
+    if name == "sim_params":
         from simulation.war.war_loader import sim_params as data
+        globals()["sim_params"] = data
         return data
-    def __getitem__(self, key):
-        return self._data()[key]
-    def __setitem__(self, key, value):
-        self._data()[key] = value
-    def __iter__(self):
-        return iter(self._data())
-    def items(self):
-        return self._data().items()
-    def keys(self):
-        return self._data().keys()
-    def values(self):
-        return self._data().values()
-    def get(self, key, default=None):
-        return self._data().get(key, default)
-    def update(self, *args, **kwargs):
-        return self._data().update(*args, **kwargs)
-    def __repr__(self):
-        return repr(self._data())
-
-sim_params = _SimParamsProxy()
-
-
-def run(argv: List[str] | None = None) -> None:  # pragma: no cover - manual launch
-    parser = argparse.ArgumentParser(description="War simulation viewer")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def run(
+    argv: List[str] | None = None,
+    *,
+    description: str = "War simulation viewer",
+    config_file: str | None = None,
+    use_cache: bool = False,
+) -> None:  # pragma: no cover - manual launch
+    """Parse launcher options and start the viewer loop.
+
+    Other launchers (see ``run_colony.py``) reuse this entry point with their
+    own *description* and default *config_file*. *use_cache* turns terrain
+    caching on without the ``--terrain-cache`` flag.
+    """
+
+    parser = argparse.ArgumentParser(description=description)
     parser.add_argument(
         "--viewer",
         choices=["pygame", "moderngl"],
         default="pygame",
         help="Backend graphique à utiliser",
     )
+    parser.add_argument(
+        "--config",
+        default=config_file,
+        help="Fichier de configuration du monde",
+    )
+    parser.add_argument(
+        "--terrain-cache",
+        action="store_true",
+        help="Réutiliser au démarrage le terrain de terrain_cache.pkl s'il "
+        "correspond à la configuration, et y enregistrer les terrains générés",
+    )
     args = parser.parse_args(argv)
 
-    cache_path = os.path.join(os.path.dirname(__file__), "terrain_cache.pkl")
-    if os.path.exists(cache_path):
-        os.environ.setdefault("WAR_TERRAIN_CACHE", cache_path)
+    if use_cache or args.terrain_cache:
+        os.environ.setdefault("WAR_TERRAIN_CACHE", TERRAIN_CACHE)
     from simulation.war.viewer_loop import run as viewer_run
-    viewer_run(viewer=args.viewer)
+    viewer_run(viewer=args.viewer, config_file=args.config)
 
 if __name__ == "__main__":  # pragma: no cover - manual launch
     run()
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import logging
+import random
 import time
+from typing import List, Optional, Set, Tuple
 
+from nodes.world import world_rng
 from simulation.war.nodes import TerrainNode
 from simulation.war.terrain import (
     carve_river,
@@ -17,14 +20,36 @@ from simulation.war.terrain import (
 logger = logging.getLogger(__name__)
 
 
+GeneratedTerrain = Tuple[List[bytearray], Set[Tuple[int, int]], Optional[List[List[float]]]]
+
+
 def terrain_regen(world, params: dict) -> None:
-    """Regenerate terrain tiles according to *params*."""
+    """Regenerate terrain tiles according to *params*.
+
+    Draws from the world's random stream, so a seeded world always gets the
+    same map.
+    """
 
-    terrain = next((c for c in world.children if isinstance(c, TerrainNode)), None)
+    terrain = world.get_child_of_type(TerrainNode)
     if terrain is None:
         return
+    apply_terrain(
+        terrain,
+        generate_terrain(int(world.width), int(world.height), params, world_rng(world)),
+    )
+
+
+def generate_terrain(
+    width: int, height: int, params: dict, rng: random.Random | None = None
+) -> GeneratedTerrain:
+    """Return ``(tiles, obstacles, altitude_map)`` for a new map.
+
+    The function only touches its arguments, so it can run in a worker
+    process; hand the result to :func:`apply_terrain` in the simulation
+    process. *rng* defaults to the global :mod:`random` module; pass a
+    :class:`random.Random` (which pickles) to make the map reproducible.
+    """
 
-    width, height = int(world.width), int(world.height)
     start_time = time.perf_counter()
 
     tiles = generate_base(width, height, fill="plain")
@@ -43,6 +68,7 @@ def terrain_regen(world, params: dict) -> None:
             width_max=river.get("width_max", 5),
             meander=river.get("meander", 0.3),
             obstacles_set=obstacles,
+            rng=rng,
         )
     logger.info("Rivers carved in %.2fs", time.perf_counter() - step_start)
 
@@ -54,6 +80,7 @@ def terrain_regen(world, params: dict) -> None:
             radius=lake.get("radius", 20),
             irregularity=lake.get("irregularity", 0.4),
             obstacles_set=obstacles,
+            rng=rng,
         )
     logger.info("Lakes placed in %.2fs", time.perf_counter() - step_start)
 
@@ -65,6 +92,7 @@ def terrain_regen(world, params: dict) -> None:
         clusters=forests.get("clusters", 5),
         cluster_spread=forests.get("cluster_spread", 0.5),
         obstacles_set=obstacles,
+        rng=rng,
     )
     logger.info("Forests placed in %.2fs", time.perf_counter() - step_start)
 
@@ -78,6 +106,7 @@ def terrain_regen(world, params: dict) -> None:
         altitude_map_out=None,
         obstacles_set=obstacles,
         obstacle_threshold=params.get("obstacle_altitude_threshold", 0.75),
+        rng=rng,
     )
     logger.info("Mountains generated in %.2fs", time.perf_counter() - step_start)
 
@@ -89,26 +118,31 @@ def terrain_regen(world, params: dict) -> None:
         desert_pct=swamp_desert.get("desert_pct", 5),
         clumpiness=swamp_desert.get("clumpiness", 0.5),
         obstacles_set=obstacles,
+        rng=rng,
     )
     logger.info("Swamps and deserts placed in %.2fs", time.perf_counter() - step_start)
     logger.info("Terrain regeneration finished in %.2fs", time.perf_counter() - start_time)
+    return tiles, obstacles, altitude_map
+
 
+def apply_terrain(terrain: TerrainNode, generated: GeneratedTerrain) -> None:
+    """Install a :func:`generate_terrain` result on *terrain*."""
+
+    tiles, obstacles, altitude_map = generated
     terrain.tiles = tiles
     terrain.obstacles = obstacles
     terrain.altitude_map = altitude_map
-    terrain.speed_modifiers.update(
-        {
+    terrain.update_modifiers(
+        speed={
             "water": 0.4,
             "mountain": 0.6,
             "swamp": 0.5,
             "desert": 0.8,
-        }
-    )
-    terrain.combat_bonuses.update(
-        {
+        },
+        combat={
             "water": -2,
             "mountain": 3,
             "swamp": -1,
             "desert": 0,
-        }
+        },
     )
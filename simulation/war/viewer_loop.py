@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import random
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+
 import pygame
 
 import config
+from nodes.world import world_rng
 from simulation.war.ui import ModernGLViewerSystem, PygameViewerSystem
 from simulation.war.war_loader import (
     load_plugins_for_war,
@@ -14,32 +20,97 @@ from simulation.war.war_loader import (
     setup_world,
     sim_params,
 )
+from simulation.war.terrain_setup import GeneratedTerrain, generate_terrain
+
+logger = logging.getLogger(__name__)
+
+# Event types consumed by this loop and the viewers' ``process_events``.
+# Everything else (mouse motion, window/focus noise...) is dropped by SDL
+# before it reaches the queue, so each frame only drains relevant events.
+_HANDLED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEWHEEL,
+)
+
+_NO_EVENTS: tuple = ()
+
+# Held pan keys (Q/D/Z/S) scroll this many view widths/heights per second.
+_PAN_VIEWS_PER_SECOND = 1.0
 
 
-def run(viewer: str = "pygame") -> None:
-    """Run the interactive viewer for the war simulation."""
+def run(viewer: str = "pygame", config_file: str | None = None) -> None:
+    """Run the interactive viewer for the war simulation.
+
+    *config_file* is forwarded to :func:`setup_world`; ``None`` keeps its
+    default world.
+    """
 
     if "DISPLAY" not in os.environ and os.environ.get("SDL_VIDEODRIVER") is None:
         os.environ["SDL_VIDEODRIVER"] = "dummy"
     pygame.init()
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(_HANDLED_EVENTS)
 
     load_plugins_for_war()
-    world, _, pathfinder = setup_world()
+    # The reset below builds the terrain.
+    world, _, pathfinder = setup_world(config_file, generate_terrain=False)
 
     viewer_cls = PygameViewerSystem
     if viewer == "moderngl":
         viewer_cls = ModernGLViewerSystem
     viewer = viewer_cls(parent=world)
     movement_system = None
+    regen_pool: ProcessPoolExecutor | None = None
+    pending_terrain: Future | None = None
 
-    def _reset() -> None:
+    def _reset(
+        generated: GeneratedTerrain | None = None, use_cache: bool = True
+    ) -> None:
         nonlocal movement_system
-        movement_system = reset_world(world, pathfinder)
+        movement_system = reset_world(world, pathfinder, generated, use_cache)
         if movement_system:
             movement_system.direction_noise = 0.2
             movement_system.avoid_obstacles = True
             movement_system.pathfinder = pathfinder
 
+    def _request_reset() -> None:
+        # R always asks for a fresh map, cache or not: the terrain cache only
+        # seeds startup. Generation runs in a worker process so the loop
+        # keeps rendering the current map and swaps in the new one once it
+        # is ready.
+        nonlocal regen_pool, pending_terrain
+        if pending_terrain is not None:
+            return
+        if regen_pool is None:
+            regen_pool = ProcessPoolExecutor(max_workers=1)
+        pending_terrain = regen_pool.submit(
+            generate_terrain,
+            int(world.width),
+            int(world.height),
+            dict(sim_params["terrain"]),
+            # The worker gets its own generator seeded from the world stream,
+            # so seeded worlds still regenerate the same sequence of maps.
+            random.Random(world_rng(world).getrandbits(64)),
+        )
+
+    def _install_pending_terrain() -> None:
+        nonlocal regen_pool, pending_terrain
+        future, pending_terrain = pending_terrain, None
+        try:
+            generated = future.result()
+        except Exception:
+            logger.exception(
+                "Background terrain generation failed, regenerating in-process"
+            )
+            # A dead worker leaves the pool broken; start a new one next time.
+            regen_pool.shutdown(wait=False, cancel_futures=True)
+            regen_pool = None
+            _reset(use_cache=False)
+            return
+        _reset(generated)
+
     _reset()
 
     # Center the view on the world by default
@@ -59,53 +130,86 @@ def run(viewer: str = "pygame") -> None:
     TIME_SCALE = config.TIME_SCALE
     clock = pygame.time.Clock()
 
+    def _zoom(factor: float) -> None:
+        prev = viewer.scale
+        viewer.scale = max(0.1, viewer.scale * factor)
+        cx = viewer.offset_x + viewer.view_width / (2 * prev)
+        cy = viewer.offset_y + viewer.view_height / (2 * prev)
+        viewer.offset_x = cx - viewer.view_width / (2 * viewer.scale)
+        viewer.offset_y = cy - viewer.view_height / (2 * viewer.scale)
+
+    # One-shot commands looked up per pressed key: ``once`` handlers run a
+    # single time per frame however often the key repeated, ``per_press``
+    # handlers run once for every press.
+    once_actions = {pygame.K_r: _request_reset}
+    per_press_actions = {pygame.K_u: lambda: spawn_builder(world)}
+
     paused = True
+    # Simulation seconds per wall-clock second; 0 while paused, which also
+    # skips the world update. Recomputed only when pause or the time scale
+    # changes.
+    effective_scale = 0.0
+    world_update = world.update
+    clock_tick = clock.tick
+    get_pressed = pygame.key.get_pressed
     running = True
-    while running and pygame.get_init():
-        events = pygame.event.get()
-        for event in events:
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
+    while running:
+        # ``peek`` pumps SDL and reports whether anything is queued, so idle
+        # frames skip building an event list and the key bookkeeping below.
+        events = pygame.event.get() if pygame.event.peek() else _NO_EVENTS
+        if events:
+            # Key repeats can queue several presses per frame; fold them into
+            # per-key counts so each control is applied once with its net
+            # effect.
+            presses: Counter[int] = Counter()
+            for event in events:
+                if event.type == pygame.KEYDOWN:
+                    presses[event.key] += 1
+                elif event.type == pygame.QUIT:
+                    running = False
+            if presses:
+                for key, count in presses.items():
+                    action = once_actions.get(key)
+                    if action is not None:
+                        action()
+                        continue
+                    action = per_press_actions.get(key)
+                    if action is not None:
+                        for _ in range(count):
+                            action()
+                if presses[pygame.K_SPACE] & 1:
                     paused = not paused
-                elif event.key == pygame.K_r:
-                    _reset()
-                elif event.key == pygame.K_c:
-                    TIME_SCALE = max(0.01, TIME_SCALE / 2)
-                elif event.key == pygame.K_x:
-                    TIME_SCALE = min(100, TIME_SCALE * 2)
-                elif event.key == pygame.K_LEFTBRACKET:
-                    prev = viewer.scale
-                    viewer.scale = max(0.1, viewer.scale * 0.9)
-                    cx = viewer.offset_x + viewer.view_width / (2 * prev)
-                    cy = viewer.offset_y + viewer.view_height / (2 * prev)
-                    viewer.offset_x = cx - viewer.view_width / (2 * viewer.scale)
-                    viewer.offset_y = cy - viewer.view_height / (2 * viewer.scale)
-                elif event.key == pygame.K_RIGHTBRACKET:
-                    prev = viewer.scale
-                    viewer.scale = viewer.scale * 1.1
-                    cx = viewer.offset_x + viewer.view_width / (2 * prev)
-                    cy = viewer.offset_y + viewer.view_height / (2 * prev)
-                    viewer.offset_x = cx - viewer.view_width / (2 * viewer.scale)
-                    viewer.offset_y = cy - viewer.view_height / (2 * viewer.scale)
-                elif event.key == pygame.K_q:
-                    viewer.offset_x -= viewer.view_width * 0.1 / viewer.scale
-                elif event.key == pygame.K_d:
-                    viewer.offset_x += viewer.view_width * 0.1 / viewer.scale
-                elif event.key == pygame.K_s:
-                    viewer.offset_y += viewer.view_height * 0.1 / viewer.scale
-                elif event.key == pygame.K_z:
-                    viewer.offset_y -= viewer.view_height * 0.1 / viewer.scale
-                elif event.key == pygame.K_u:
-                    spawn_builder(world)
-                # no additional controls when paused
+                time_steps = presses[pygame.K_x] - presses[pygame.K_c]
+                if time_steps:
+                    TIME_SCALE = min(100, max(0.01, TIME_SCALE * 2.0 ** time_steps))
+                effective_scale = 0.0 if paused else TIME_SCALE
+                zoom_in = presses[pygame.K_RIGHTBRACKET]
+                zoom_out = presses[pygame.K_LEFTBRACKET]
+                if zoom_in or zoom_out:
+                    _zoom(1.1 ** zoom_in * 0.9 ** zoom_out)
+
+        if pending_terrain is not None and pending_terrain.done():
+            _install_pending_terrain()
 
         viewer.extra_info = []
         viewer.set_menu_items([])
         viewer.process_events(events)
-        dt = clock.tick(FPS) / 1000.0
-        world.update(0 if paused else dt * TIME_SCALE)
+        dt = clock_tick(FPS) / 1000.0
+        # Camera pan follows held keys at a steady rate instead of the OS
+        # key-repeat cadence.
+        keys = get_pressed()
+        pan_x = keys[pygame.K_d] - keys[pygame.K_q]
+        pan_y = keys[pygame.K_s] - keys[pygame.K_z]
+        if pan_x or pan_y:
+            step = _PAN_VIEWS_PER_SECOND * dt / viewer.scale
+            viewer.offset_x += pan_x * viewer.view_width * step
+            viewer.offset_y += pan_y * viewer.view_height * step
+        if effective_scale:
+            # Paused: skip the scene-graph traversal entirely rather than
+            # ticking every node with dt=0; the viewer renders regardless.
+            world_update(dt * effective_scale)
         viewer.render(dt)
 
+    if regen_pool is not None:
+        regen_pool.shutdown(wait=False, cancel_futures=True)
     pygame.quit()
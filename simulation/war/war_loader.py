@@ -1,11 +1,13 @@
 """Loading utilities for the war simulation."""
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import pickle
 import sys
+import tempfile
 
 import config
 from core.loader import load_simulation_from_file
@@ -23,12 +25,15 @@ from systems.ai import AISystem
 from systems.scheduler import SchedulerSystem
 from simulation.war.presets import DEFAULT_SIM_PARAMS
 from simulation.war.systems import MovementSystem, PathfindingSystem
-from simulation.war.terrain_setup import terrain_regen
+from simulation.war.terrain_setup import GeneratedTerrain, apply_terrain, terrain_regen
 
 logger = logging.getLogger(__name__)
 
 sim_params = dict(DEFAULT_SIM_PARAMS)
 sim_params["terrain"] = {}
+# Config file loaded by the last :func:`setup_world` call; part of the
+# terrain cache key.
+_config_file: str | None = None
 
 
 def load_plugins_for_war() -> None:
@@ -49,6 +54,7 @@ def load_plugins_for_war() -> None:
             "nodes.building",
             "nodes.resource",
             "nodes.builder",
+            "nodes.road",
             "nodes.worker",
             "systems.movement",
             "systems.combat",
@@ -76,11 +82,24 @@ def load_sim_params(path: str) -> dict:
     return params
 
 
-def setup_world(config_file: str | None = None, settings_file: str | None = None):
-    """Load the world and simulation parameters."""
+def setup_world(
+    config_file: str | None = None,
+    settings_file: str | None = None,
+    *,
+    generate_terrain: bool = True,
+):
+    """Load the world and simulation parameters.
 
+    The terrain is generated as well unless *generate_terrain* is false.
+    Callers that build the map themselves right afterwards, such as the
+    viewer through :func:`reset_world`, pass ``False`` so it is not built
+    twice; the terrain node then keeps the tiles from the config file.
+    """
+
+    global _config_file
     config_file = config_file or "example/flat_1km_config.json"
     world = load_simulation_from_file(config_file)
+    _config_file = config_file
 
     ai = AISystem(
         parent=world,
@@ -93,18 +112,18 @@ def setup_world(config_file: str | None = None, settings_file: str | None = None
     # Ensure a SchedulerSystem is present so that newly spawned workers can be
     # registered for periodic updates. If one is already defined in the config
     # file it is reused, otherwise we create it here.
-    if not any(isinstance(c, SchedulerSystem) for c in world.children):
+    if world.get_child_of_type(SchedulerSystem) is None:
         SchedulerSystem(parent=world)
 
 
-    terrain_node = next((c for c in world.children if isinstance(c, TerrainNode)), None)
+    terrain_node = world.get_child_of_type(TerrainNode)
     terrain_params = dict(getattr(terrain_node, "params", {})) if terrain_node else {}
     terrain_params.setdefault("forests", {"total_area_pct": 10, "clusters": 5, "cluster_spread": 0.5})
     terrain_params.setdefault("mountains", {"total_area_pct": 5, "perlin_scale": 0.01, "peak_density": 0.2})
     terrain_params.setdefault("swamp_desert", {"swamp_pct": 3, "desert_pct": 5, "clumpiness": 0.5})
 
-    movement_system = next((c for c in world.children if isinstance(c, MovementSystem)), None)
-    pathfinder = next((c for c in world.children if isinstance(c, PathfindingSystem)), None)
+    movement_system = world.get_child_of_type(MovementSystem)
+    pathfinder = world.get_child_of_type(PathfindingSystem)
     if pathfinder is None:
         pathfinder = PathfindingSystem(parent=world, terrain=terrain_node)
 
@@ -116,7 +135,8 @@ def setup_world(config_file: str | None = None, settings_file: str | None = None
 
     world.width = sim_params.get("map_width", world.width)
     world.height = sim_params.get("map_height", world.height)
-    terrain_regen(world, terrain_params)
+    if generate_terrain:
+        terrain_regen(world, terrain_params)
 
     ai.city_influence_radius = sim_params.get("city_influence_radius", 0)
     ai.builder_spawn_interval = sim_params.get("builder_spawn_interval", 0.0)
@@ -132,7 +152,7 @@ def setup_world(config_file: str | None = None, settings_file: str | None = None
             "unit_speed", movement_system.wander_speed
         )
 
-    for nation in [n for n in world.children if isinstance(n, NationNode)]:
+    for nation in world.get_children_of_type(NationNode):
         nation.city_influence_radius = sim_params.get("city_influence_radius", 0)
 
 
@@ -142,12 +162,12 @@ def setup_world(config_file: str | None = None, settings_file: str | None = None
 def spawn_builder(world) -> BuilderNode | None:
     """Spawn a :class:`BuilderNode` at the capital of the main nation."""
 
-    nation = next((c for c in world.children if isinstance(c, NationNode)), None)
+    nation = world.get_child_of_type(NationNode)
     if nation is None:
         return None
 
     capital = getattr(nation, "capital_position", [world.width / 2, world.height / 2])
-    count = sum(1 for c in nation.children if isinstance(c, BuilderNode))
+    count = len(nation.get_children_of_type(BuilderNode))
     builder = BuilderNode(
         name=f"{nation.name}_builder_{count + 1}",
         state="exploring",
@@ -170,14 +190,14 @@ def _spawn_armies(
 ) -> None:
     """Spawn hierarchical armies for each nation."""
 
-    nations = [n for n in world.children if isinstance(n, NationNode)]
+    nations = world.get_children_of_type(NationNode)
     width, height = world.width, world.height
     for nation in nations:
-        general = next((c for c in nation.children if isinstance(c, GeneralNode)), None)
+        general = nation.get_child_of_type(GeneralNode)
         if general is None:
             continue
 
-        transform = next((c for c in general.children if isinstance(c, TransformNode)), None)
+        transform = general.get_child_of_type(TransformNode)
         for child in list(general.children):
             if child is not transform:
                 general.remove_child(child)
@@ -190,10 +210,10 @@ def _spawn_armies(
         strategist = StrategistNode(name=f"{nation.name}_strategist")
         general.add_child(strategist)
 
-        for child in list(nation.children):
-            if isinstance(child, BuilderNode):
-                nation.remove_child(child)
+        for child in nation.get_children_of_type(BuilderNode):
+            nation.remove_child(child)
 
+        builders = []
         for i in range(3):
             builder = BuilderNode(
                 name=f"{nation.name}_builder_{i+1}",
@@ -203,30 +223,132 @@ def _spawn_armies(
                 build_duration=sim_params.get("build_duration", 0.0),
             )
             builder.add_child(TransformNode(position=list(center)))
-            nation.add_child(builder)
+            builders.append(builder)
+        nation.add_children(builders)
+        for builder in builders:
             builder.emit("unit_idle", {}, direction="up")
 
 
 
-def reset_world(world, pathfinder: PathfindingSystem | None = None) -> MovementSystem | None:
-    """Reset terrain using current ``sim_params`` without spawning armies."""
+def terrain_cache_key(world) -> str:
+    """Return the cache key for terrain generated for *world*.
+
+    The key hashes the map size, the current ``sim_params["terrain"]`` and
+    the contents of the config file loaded by :func:`setup_world`, so a
+    cache written for another configuration is never reused.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    spec = {
+        "width": int(world.width),
+        "height": int(world.height),
+        "params": sim_params.get("terrain", {}),
+    }
+    digest.update(json.dumps(spec, sort_keys=True, default=str).encode("utf8"))
+    if _config_file and os.path.exists(_config_file):
+        with open(_config_file, "rb") as fh:
+            digest.update(fh.read())
+    return digest.hexdigest()
+
+
+def save_terrain_cache(terrain: TerrainNode, path: str, key: str) -> None:
+    """Write the generated state of *terrain* to the pickle file *path*.
+
+    The data is written to a temporary file next to *path* and moved into
+    place, so an interrupted write never leaves a truncated cache behind.
+    """
+
+    data = {
+        "key": key,
+        "tile_bytes": terrain.tile_bytes(),
+        "width": terrain.width,
+        "obstacles": list(terrain.obstacles),
+        "altitude_map": (
+            [row.tolist() for row in terrain.altitude_map]
+            if terrain.altitude_map is not None
+            else None
+        ),
+        "speed_modifiers": dict(terrain.speed_modifiers),
+        "combat_bonuses": dict(terrain.combat_bonuses),
+        "params": sim_params["terrain"],
+    }
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(data, fh)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_terrain_cache(terrain: TerrainNode, path: str, key: str) -> bool:
+    """Restore *terrain* from the cache at *path*.
+
+    Returns ``False`` without touching *terrain* when the file is missing,
+    unreadable, older than the loaded config file or written under a key
+    other than *key* (see :func:`terrain_cache_key`).
+    """
+
+    if not os.path.exists(path):
+        return False
+    if (
+        _config_file
+        and os.path.exists(_config_file)
+        and os.path.getmtime(_config_file) > os.path.getmtime(path)
+    ):
+        logger.info("Ignoring terrain cache %s older than %s", path, _config_file)
+        return False
+    try:
+        with open(path, "rb") as fh:
+            data = pickle.load(fh)
+    except Exception as exc:  # truncated or foreign pickles fail in many ways
+        logger.warning("Ignoring unreadable terrain cache %s: %s", path, exc)
+        return False
+    if not isinstance(data, dict) or data.get("key") != key:
+        logger.info("Ignoring terrain cache %s written for other settings", path)
+        return False
+    terrain.set_tile_bytes(data["tile_bytes"], data["width"])
+    terrain.obstacles = {tuple(o) for o in data.get("obstacles", [])}
+    terrain.altitude_map = data.get("altitude_map")
+    terrain.update_modifiers(
+        speed=data.get("speed_modifiers"),
+        combat=data.get("combat_bonuses"),
+    )
+    return True
+
+
+def reset_world(
+    world,
+    pathfinder: PathfindingSystem | None = None,
+    generated: GeneratedTerrain | None = None,
+    use_cache: bool = True,
+) -> MovementSystem | None:
+    """Reset terrain using current ``sim_params`` without spawning armies.
+
+    Terrain caching is opt-in: only when the ``WAR_TERRAIN_CACHE``
+    environment variable names a file is a cache matching
+    :func:`terrain_cache_key` loaded, and freshly generated terrain written
+    back to it. ``use_cache=False`` always generates a new map. Passing
+    *generated*, a :func:`~simulation.war.terrain_setup.generate_terrain`
+    result computed elsewhere, installs it instead of generating here.
+    """
 
     cache_path = os.environ.get("WAR_TERRAIN_CACHE")
-    if cache_path and os.path.exists(cache_path):
-        with open(cache_path, "rb") as fh:
-            data = pickle.load(fh)
-        terrain = next((c for c in world.children if isinstance(c, TerrainNode)), None)
-        if terrain is not None:
-            terrain.tiles = [bytearray(row) for row in data.get("tiles", [])]
-            terrain.obstacles = {tuple(o) for o in data.get("obstacles", [])}
-            terrain.altitude_map = data.get("altitude_map")
-            terrain.speed_modifiers.update(data.get("speed_modifiers", {}))
-            terrain.combat_bonuses.update(data.get("combat_bonuses", {}))
-            sim_params["terrain"] = data.get("params", {})
+    terrain = world.get_child_of_type(TerrainNode)
+    key = terrain_cache_key(world) if cache_path and terrain is not None else None
+    if terrain is not None and generated is not None:
+        apply_terrain(terrain, generated)
+    elif key is not None and use_cache and load_terrain_cache(terrain, cache_path, key):
+        key = None  # loaded from the cache, nothing to write back
     else:
         terrain_regen(world, sim_params["terrain"])
+    if key is not None:
+        save_terrain_cache(terrain, cache_path, key)
     # Armies are no longer spawned automatically to start with an empty world
-    movement_system = next((c for c in world.children if isinstance(c, MovementSystem)), None)
+    movement_system = world.get_child_of_type(MovementSystem)
     if movement_system:
         movement_system.set_blocking(sim_params.get("movement_blocking", True))
         movement_system.wander_drift = sim_params.get("wander_drift", movement_system.wander_drift)
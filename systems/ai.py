@@ -67,7 +67,7 @@ class AISystem(SystemNode):
                 while root.parent is not None:
                     root = root.parent
                 for nation in self._iter_nations(root):
-                    count = sum(1 for c in nation.children if isinstance(c, BuilderNode))
+                    count = len(nation.get_children_of_type(BuilderNode))
                     builder = BuilderNode(
                         name=f"{nation.name}_builder_{count + 1}",
                         state="exploring",
@@ -197,10 +197,7 @@ class AISystem(SystemNode):
     def _get_transform(self, node: SimNode) -> TransformNode | None:
         if isinstance(node, TransformNode):
             return node
-        for child in node.children:
-            if isinstance(child, TransformNode):
-                return child
-        return None
+        return node.get_child_of_type(TransformNode)
 
     # ------------------------------------------------------------------
     def _get_explored(self, unit: SimNode) -> set[tuple[int, int]]:
@@ -252,10 +249,7 @@ class AISystem(SystemNode):
         node = self
         while node.parent is not None:
             node = node.parent
-        for child in node.children:
-            if isinstance(child, TerrainNode):
-                return child
-        return None
+        return node.get_child_of_type(TerrainNode)
 
     # ------------------------------------------------------------------
     def _is_free(self, pos: tuple[int, int]) -> bool:
@@ -280,10 +274,7 @@ class AISystem(SystemNode):
         node = self
         while node.parent is not None:
             node = node.parent
-        for child in node.children:
-            if isinstance(child, VisibilitySystem):
-                return child
-        return None
+        return node.get_child_of_type(VisibilitySystem)
 
 
 register_node_type("AISystem", AISystem)
@@ -1,7 +1,6 @@
 """System resolving combat between opposing units on the same tile."""
 from __future__ import annotations
 
-import random
 from typing import Iterable
 
 from core.simnode import SystemNode, SimNode
@@ -11,6 +10,7 @@ from nodes.terrain import TerrainNode
 from nodes.transform import TransformNode
 from nodes.nation import NationNode
 from nodes.building import BuildingNode
+from nodes.world import world_rng
 
 
 class CombatSystem(SystemNode):
@@ -59,10 +59,7 @@ class CombatSystem(SystemNode):
     def _get_transform(self, node: SimNode) -> TransformNode | None:
         if isinstance(node, TransformNode):
             return node
-        for child in node.children:
-            if isinstance(child, TransformNode):
-                return child
-        return None
+        return node.get_child_of_type(TransformNode)
 
     # ------------------------------------------------------------------
     def _get_nation(self, node: SimNode) -> NationNode | None:
@@ -105,8 +102,9 @@ class CombatSystem(SystemNode):
         a.engage(b)
         b.engage(a)
         bonus = self.terrain.get_combat_bonus(x, y) if self.terrain is not None else 0
-        strength_a = a.size + bonus + random.randint(0, 10)
-        strength_b = b.size + bonus + random.randint(0, 10)
+        rng = world_rng(self)
+        strength_a = a.size + bonus + rng.randint(0, 10)
+        strength_b = b.size + bonus + rng.randint(0, 10)
         if strength_a == strength_b:
             return
         if strength_a > strength_b:
@@ -11,6 +11,7 @@ from core.plugins import register_node_type
 from nodes.transform import TransformNode
 from nodes.officer import OfficerNode
 from nodes.unit import UnitNode
+from nodes.world import world_rng
 
 
 @dataclass
@@ -23,6 +24,9 @@ class _PendingOrder:
 class CommandSystem(SystemNode):
     """Handle command dispatching with delays and potential loss."""
 
+    # Random streams are runtime objects and never serialised.
+    _TRANSIENT_ATTRS = SystemNode._TRANSIENT_ATTRS | {"_rng"}
+
     def __init__(
         self,
         *,
@@ -36,7 +40,9 @@ class CommandSystem(SystemNode):
         self.base_delay_s = base_delay_s
         self.distance_delay_factor = distance_delay_factor
         self.reliability = reliability
-        self._rng = rng or random
+        # ``None`` defers to the world's stream, looked up when an order is
+        # issued since the system may be built before it joins its world.
+        self._rng = rng
         self._time = 0.0
         self._pending: List[_PendingOrder] = []
         self.on_event("order_issued", self._on_order_issued)
@@ -52,8 +58,9 @@ class CommandSystem(SystemNode):
         recipients = self._resolve_recipients(origin, order)
         if not recipients:
             return
+        rng = self._rng or world_rng(self)
         for recipient in recipients:
-            if self._rng.random() > self.reliability:
+            if rng.random() > self.reliability:
                 continue  # order lost
             delay = self._compute_delay(origin, recipient)
             order = dict(order)
@@ -106,10 +113,7 @@ class CommandSystem(SystemNode):
     def _get_transform(self, node: SimNode) -> TransformNode | None:
         if isinstance(node, TransformNode):
             return node
-        for child in node.children:
-            if isinstance(child, TransformNode):
-                return child
-        return None
+        return node.get_child_of_type(TransformNode)
 
     # ------------------------------------------------------------------
     def update(self, dt: float) -> None:
@@ -36,9 +36,9 @@ class DistanceSystem(SystemNode):
     def _get_position(self, node: SimNode) -> Tuple[float, float]:
         if isinstance(node, TransformNode):
             return tuple(node.position)
-        for child in node.children:
-            if isinstance(child, TransformNode):
-                return tuple(child.position)
+        transform = node.get_child_of_type(TransformNode)
+        if transform is not None:
+            return tuple(transform.position)
         raise ValueError(f"Node '{node.name}' has no TransformNode")
 
     def update(self, dt: float) -> None:  # pragma: no cover - trivial cache reset
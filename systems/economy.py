@@ -18,6 +18,8 @@ class EconomySystem(SystemNode):
 
         if node.kind != kind:
             raise ValueError("resource kind mismatch")
+        if amount < 0:
+            raise ValueError("amount must be non-negative")
         added = node.add(amount)
         if added:
             node.emit("resource_produced", {"kind": kind, "amount": added})
@@ -34,12 +36,14 @@ class EconomySystem(SystemNode):
         """Move resources from *src* to *dst* or consume them if ``dst`` is ``None``.
 
         Emits ``resource_consumed`` on the source and ``resource_produced`` on the
-        destination. Raises :class:`ValueError` when kinds mismatch, stock is
-        insufficient or the destination lacks capacity.
+        destination. Raises :class:`ValueError` when kinds mismatch, *amount*
+        is negative, stock is insufficient or the destination lacks capacity.
         """
 
         if src.kind != kind or (dst is not None and dst.kind != kind):
             raise ValueError("resource kind mismatch")
+        if amount < 0:
+            raise ValueError("amount must be non-negative")
         if src.quantity < amount:
             raise ValueError("insufficient stock")
         src.remove(amount)
@@ -35,10 +35,11 @@ class ModernGLViewerSystem(SystemNode, Viewer):
         self.height = height
 
     def process_events(self, events: List[Any]) -> None:
-        """Basic event processing for compatibility with the viewer loop."""
-        for event in events:
-            if event.type == pygame.QUIT:  # type: ignore[attr-defined]
-                pygame.quit()
+        """Accept events for compatibility with the viewer loop.
+
+        ``QUIT`` is handled by the loop itself, which shuts pygame down once
+        the frame in progress has finished rendering.
+        """
 
     def update(self, dt: float) -> None:
         """Update internal state (no-op for this simple viewer)."""
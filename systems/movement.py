@@ -3,7 +3,6 @@ from __future__ import annotations
 
 from math import atan2, cos, hypot, sin, pi
 from typing import Iterable, List, Optional, Dict, Tuple
-import random
 
 from core.simnode import SystemNode, SimNode
 from core.plugins import register_node_type
@@ -12,6 +11,7 @@ from nodes.unit import UnitNode
 from nodes.terrain import TerrainNode
 from nodes.transform import TransformNode
 from nodes.nation import NationNode
+from nodes.world import world_rng
 from systems.pathfinding import PathfindingSystem
 
 
@@ -110,10 +110,7 @@ class MovementSystem(SystemNode):
     def _get_transform(self, node: SimNode) -> TransformNode | None:
         if isinstance(node, TransformNode):
             return node
-        for child in node.children:
-            if isinstance(child, TransformNode):
-                return child
-        return None
+        return node.get_child_of_type(TransformNode)
 
     # ------------------------------------------------------------------
     def _get_nation(self, node: SimNode) -> NationNode | None:
@@ -127,6 +124,7 @@ class MovementSystem(SystemNode):
     def update(self, dt: float) -> None:
         self._resolve_terrain()
         self._resolve_pathfinder()
+        rng = world_rng(self)
         blocked_tiles = set(self.obstacles)
         tile_units: Dict[Tuple[int, int], list[UnitNode]] = {}
         units: list[tuple[UnitNode, TransformNode]] = []
@@ -185,7 +183,7 @@ class MovementSystem(SystemNode):
                 else:
                     angle = atan2(dy, dx)
                     if self.direction_noise > 0:
-                        angle += random.uniform(-self.direction_noise, self.direction_noise)
+                        angle += rng.uniform(-self.direction_noise, self.direction_noise)
                     new_x = tx + cos(angle) * step
                     new_y = ty + sin(angle) * step
                 ix, iy = int(round(new_x / METERS_PER_TILE)), int(round(new_y / METERS_PER_TILE))
@@ -229,8 +227,8 @@ class MovementSystem(SystemNode):
                 )
                 continue
             if getattr(unit, "state", "") == "exploring":
-                angle = getattr(unit, "_wander_angle", random.uniform(-pi, pi))
-                angle += random.uniform(-self.wander_drift, self.wander_drift)
+                angle = getattr(unit, "_wander_angle", rng.uniform(-pi, pi))
+                angle += rng.uniform(-self.wander_drift, self.wander_drift)
                 nation = nations.get(unit)
                 if nation is not None:
                     cx, cy = nation.capital_position
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import heapq
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Set
 
 from core.simnode import SystemNode, SimNode
 from core.plugins import register_node_type
@@ -44,10 +44,6 @@ class PathfindingSystem(SystemNode):
                 return found
         return None
 
-    # ------------------------------------------------------------------
-    def _heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> float:
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
     # ------------------------------------------------------------------
     def find_path(
         self,
@@ -57,40 +53,137 @@ class PathfindingSystem(SystemNode):
     ) -> List[Tuple[int, int]]:
         """Return a list of coordinates from ``start`` to ``goal``.
 
-        If no path is found an empty list is returned. ``blocked`` may contain
-        additional temporarily impassable coordinates such as ongoing combats.
+        If no path is found, or either endpoint lies outside the terrain, an
+        empty list is returned. ``blocked`` may contain additional temporarily
+        impassable coordinates such as ongoing combats.
         """
 
         self._resolve_terrain()
         terrain = self.terrain
         if terrain is None:
             return []
+        w = terrain.width
+        h = terrain.height
+        sx, sy = start
+        gx, gy = goal
+        if not (0 <= sx < w and 0 <= sy < h and 0 <= gx < w and 0 <= gy < h):
+            return []
         blocked = blocked or set()
-        get_neighbors = terrain.get_neighbors
-        is_obstacle = terrain.is_obstacle
-        get_speed = terrain.get_speed_modifier
-        heuristic = self._heuristic
-        open_set: List[Tuple[float, Tuple[int, int]]] = [(0.0, start)]
-        came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-        g_score: Dict[Tuple[int, int], float] = {start: 0.0}
+        grid, obstacle_mask, offsets, step_cost = terrain.path_grid()
+        inf = float("inf")
+        # Nodes are encoded as ``x * h + y`` which orders exactly like the
+        # ``(x, y)`` tuples used for heap tie-breaking before.
+        start_id = sx * h + sy
+        goal_id = gx * h + gy
+        open_set: List[Tuple[float, int]] = [(0.0, start_id)]
+        came_from: Dict[int, int] = {}
+        g_score: Dict[int, float] = {start_id: 0.0}
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        while open_set:
+            _, current = heappop(open_set)
+            if current == goal_id:
+                path = [(gx, gy)]
+                while current in came_from:
+                    current = came_from[current]
+                    path.append(divmod(current, h))
+                path.reverse()
+                return path
+            cx, cy = divmod(current, h)
+            g_current = g_score[current]
+            for dx, dy in offsets:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < w and 0 <= ny < h):
+                    continue
+                tile = ny * w + nx
+                if obstacle_mask[tile] or (blocked and (nx, ny) in blocked):
+                    continue
+                tentative = g_current + step_cost[grid[tile]]
+                neighbor = nx * h + ny
+                if tentative >= g_score.get(neighbor, inf):
+                    continue
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative
+                heappush(
+                    open_set,
+                    (tentative + abs(nx - gx) + abs(ny - gy), neighbor),
+                )
+        return []
+
+    # ------------------------------------------------------------------
+    def find_nearest(
+        self,
+        start: Tuple[int, int],
+        goals: Iterable[Tuple[int, int]],
+        blocked: Optional[Set[Tuple[int, int]]] = None,
+        max_cost: float | None = None,
+    ) -> List[Tuple[int, int]]:
+        """Return the cheapest path from ``start`` to any of ``goals``.
+
+        A single Dijkstra expansion replaces one :meth:`find_path` call per
+        goal. Step costs and ``blocked`` behave as in :meth:`find_path`;
+        goals outside the terrain are ignored. The search gives up once the
+        path cost would exceed ``max_cost``. An empty list is returned when
+        no goal is reachable.
+
+        "Cheapest" weighs each step by terrain speed rather than counting
+        tiles, so a goal behind slow terrain can lose to a farther goal
+        reached over fast terrain.
+        """
+
+        self._resolve_terrain()
+        terrain = self.terrain
+        if terrain is None:
+            return []
+        w = terrain.width
+        h = terrain.height
+        sx, sy = start
+        if not (0 <= sx < w and 0 <= sy < h):
+            return []
+        goal_ids = {
+            gx * h + gy for gx, gy in goals if 0 <= gx < w and 0 <= gy < h
+        }
+        if not goal_ids:
+            return []
+        grid, obstacle_mask, offsets, step_cost = terrain.path_grid()
+        inf = float("inf")
+        limit = inf if max_cost is None else max_cost
+        start_id = sx * h + sy
+        open_set: List[Tuple[float, int]] = [(0.0, start_id)]
+        came_from: Dict[int, int] = {}
+        g_score: Dict[int, float] = {start_id: 0.0}
+        heappush = heapq.heappush
+        heappop = heapq.heappop
         while open_set:
-            _, current = heapq.heappop(open_set)
-            if current == goal:
-                path = [current]
+            g_current, current = heappop(open_set)
+            if g_current > g_score[current]:
+                continue
+            if current in goal_ids:
+                path = [divmod(current, h)]
                 while current in came_from:
                     current = came_from[current]
-                    path.append(current)
+                    path.append(divmod(current, h))
                 path.reverse()
                 return path
-            for neighbor in get_neighbors(*current):
-                if neighbor in blocked or is_obstacle(*neighbor):
+            cx, cy = divmod(current, h)
+            for dx, dy in offsets:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < w and 0 <= ny < h):
+                    continue
+                tile = ny * w + nx
+                if obstacle_mask[tile] or (blocked and (nx, ny) in blocked):
+                    continue
+                tentative = g_current + step_cost[grid[tile]]
+                if tentative > limit:
                     continue
-                tentative = g_score[current] + 1.0 / get_speed(*neighbor)
-                if tentative >= g_score.get(neighbor, float("inf")):
+                neighbor = nx * h + ny
+                if tentative >= g_score.get(neighbor, inf):
                     continue
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative
-                heapq.heappush(open_set, (tentative + heuristic(neighbor, goal), neighbor))
+                heappush(open_set, (tentative, neighbor))
         return []
 
 
@@ -5,7 +5,7 @@ import os
 import time
 import logging
 from math import ceil
-from typing import Any, Callable, Iterator, List, Optional, Tuple, Protocol
+from typing import Any, Callable, List, Optional, Tuple, Protocol
 
 import pygame
 
@@ -22,6 +22,7 @@ from nodes.general import GeneralNode
 from nodes.strategist import StrategistNode
 from nodes.officer import OfficerNode
 from nodes.bodyguard import BodyguardUnitNode
+from nodes.road import RoadLayerNode
 from systems.time import TimeSystem
 
 UNIT_RADIUS = 4
@@ -130,6 +131,7 @@ class PygameViewerSystem(SystemNode, Viewer):
         self._terrain_cache: pygame.Surface | None = None
         self._terrain_cache_scale = self.scale
         self._terrain_cache_size: tuple[int, int] | None = None
+        self._terrain_cache_version = -1
         self.max_terrain_resolution = max_terrain_resolution
         self._frame_count = 0
         self._log_frame_interval = 60
@@ -154,10 +156,16 @@ class PygameViewerSystem(SystemNode, Viewer):
             node = node.parent  # type: ignore[assignment]
         return node
 
-    def _walk(self, node) -> Iterator[SystemNode]:
-        yield node
-        for child in node.children:
-            yield from self._walk(child)
+    def _walk(self, node) -> List[SystemNode]:
+        """Return *node* and its descendants in pre-order as a flat list."""
+        nodes: List[SystemNode] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            nodes.append(current)
+            if current.children:
+                stack.extend(reversed(current.children))
+        return nodes
 
     # ------------------------------------------------------------------
     # Simulation API
@@ -237,22 +245,27 @@ class PygameViewerSystem(SystemNode, Viewer):
                 self.offset_y = y - self.view_height / (2 * self.scale)
                 break
 
-    def _draw_intel_overlay(self) -> None:
-        root = self._root()
-        for node in self._walk(root):
-            for child in node.children:
-                if isinstance(child, TransformNode) and isinstance(child.parent, UnitNode):
-                    px, py = child.position
-                    radius = int(
-                        getattr(child.parent, "vision_radius_m", 0.0)
-                        / config.WORLD_SCALE_M
-                        * self.scale
-                    )
-                    if radius > 0:
-                        sx = int((px - self.offset_x) * self.scale)
-                        sy = int((py - self.offset_y) * self.scale)
-                        pygame.draw.circle(self.screen, (255, 255, 255), (sx, sy), radius, 1)
-            if isinstance(node, StrategistNode):
+    def _draw_intel_overlay(self, nodes: List[SystemNode] | None = None) -> None:
+        """Draw vision radii and strategist estimates.
+
+        *nodes* is the flat walk already computed for the frame; the tree is
+        walked again only when it is not supplied.
+        """
+        if nodes is None:
+            nodes = self._walk(self._root())
+        for node in nodes:
+            if isinstance(node, TransformNode) and isinstance(node.parent, UnitNode):
+                px, py = node.position
+                radius = int(
+                    getattr(node.parent, "vision_radius_m", 0.0)
+                    / config.WORLD_SCALE_M
+                    * self.scale
+                )
+                if radius > 0:
+                    sx = int((px - self.offset_x) * self.scale)
+                    sy = int((py - self.offset_y) * self.scale)
+                    pygame.draw.circle(self.screen, (255, 255, 255), (sx, sy), radius, 1)
+            elif isinstance(node, StrategistNode):
                 for report in node.get_enemy_estimates():
                     x, y = report.get("position", [0, 0])
                     sx = int((x - self.offset_x) * self.scale)
@@ -308,6 +321,7 @@ class PygameViewerSystem(SystemNode, Viewer):
             self._terrain_cache is None
             or self._terrain_cache_scale != self.scale
             or self._terrain_cache_size != (rows, cols)
+            or self._terrain_cache_version != terrain.version
         ):
             # Clamp desired scale to stay within maximum cached resolution
             max_res = self.max_terrain_resolution
@@ -343,6 +357,7 @@ class PygameViewerSystem(SystemNode, Viewer):
             )
             self._terrain_cache_scale = cache_scale
             self._terrain_cache_size = (rows, cols)
+            self._terrain_cache_version = terrain.version
         return self._terrain_cache
 
     def _draw_terrain(self, terrain: TerrainNode) -> None:
@@ -367,11 +382,18 @@ class PygameViewerSystem(SystemNode, Viewer):
         start_time = time.perf_counter()
         self.screen.fill((30, 30, 30))
 
-        root = self._root()
-        terrain = next((n for n in self._walk(root) if isinstance(n, TerrainNode)), None)
+        nodes = self._walk(self._root())
+        # One classification pass over the frame's nodes for the lookups
+        # needed before the main drawing loop.
+        terrain: Optional[TerrainNode] = None
+        nations: List[NationNode] = []
+        for n in nodes:
+            if isinstance(n, NationNode):
+                nations.append(n)
+            elif terrain is None and isinstance(n, TerrainNode):
+                terrain = n
         if terrain is not None:
             self._draw_terrain(terrain)
-        nations = [n for n in self._walk(root) if isinstance(n, NationNode)]
         nation_colors = {n: NATION_COLORS[i % len(NATION_COLORS)] for i, n in enumerate(nations)}
         road_color = TERRAIN_COLORS[TILE_CODES["road"]]
         for n in nations:
@@ -394,7 +416,7 @@ class PygameViewerSystem(SystemNode, Viewer):
         lines: List[str] = []
         time_sys: Optional[TimeSystem] = None
         unit_count = 0
-        for node in self._walk(root):
+        for node in nodes:
             if isinstance(node, UnitNode):
                 unit_count += 1
             if isinstance(node, TransformNode):
@@ -456,11 +478,18 @@ class PygameViewerSystem(SystemNode, Viewer):
                         )
                 else:
                     pygame.draw.circle(self.screen, (200, 200, 200), pos, 3)
+            if isinstance(node, RoadLayerNode):
+                for x, y in node.tiles():
+                    pos = (
+                        int((x - self.offset_x) * self.scale),
+                        int((y - self.offset_y) * self.scale),
+                    )
+                    pygame.draw.circle(self.screen, (200, 200, 200), pos, 3)
             if isinstance(node, TimeSystem):
                 time_sys = node
 
         if self.show_intel_overlay:
-            self._draw_intel_overlay()
+            self._draw_intel_overlay(nodes)
 
         # draw a scale bar representing 1 kilometre
         grid_units_for_1km = 1000 / config.WORLD_SCALE_M
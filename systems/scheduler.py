@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional
 
 from core.simnode import SimNode, SystemNode
 from core.plugins import register_node_type
@@ -21,19 +21,27 @@ class SchedulerSystem(SystemNode):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._tasks: List[_Task] = []
+        # Latest task per node keyed by ``id(node)`` for O(1) lookups.
+        self._task_by_node: Dict[int, _Task] = {}
 
     def schedule(self, node: SimNode, interval: float) -> None:
         """Schedule *node* to be updated every *interval* seconds."""
         node._manual_update = True
-        self._tasks.append(_Task(node=node, interval=interval))
+        task = _Task(node=node, interval=interval)
+        self._tasks.append(task)
+        self._task_by_node[id(node)] = task
 
     def unschedule(self, node: SimNode) -> None:
         """Remove *node* from scheduling."""
-        for i, task in enumerate(list(self._tasks)):
-            if task.node is node:
-                del self._tasks[i]
+        if self._task_by_node.pop(id(node), None) is not None:
+            self._tasks = [task for task in self._tasks if task.node is not node]
         node._manual_update = False
 
+    def interval_of(self, node: SimNode) -> Optional[float]:
+        """Return the interval *node* is scheduled at, or ``None``."""
+        task = self._task_by_node.get(id(node))
+        return task.interval if task is not None else None
+
     def update(self, dt: float) -> None:
         for task in self._tasks:
             task.acc += dt
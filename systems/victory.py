@@ -48,10 +48,7 @@ class VictorySystem(SystemNode):
     def _get_transform(self, node: SimNode) -> TransformNode | None:
         if isinstance(node, TransformNode):
             return node
-        for child in node.children:
-            if isinstance(child, TransformNode):
-                return child
-        return None
+        return node.get_child_of_type(TransformNode)
 
     # ------------------------------------------------------------------
     def _on_building_destroyed(self, origin: SimNode, _event: str, payload: dict) -> None:
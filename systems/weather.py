@@ -1,15 +1,21 @@
 """Simple weather system emitting weather change events."""
 from __future__ import annotations
 
-import random
 from typing import List
 
 from core.simnode import SystemNode
 from core.plugins import register_node_type
+from nodes.world import world_rng
 
 
 class WeatherSystem(SystemNode):
-    """Cycle through weather states and emit events on change."""
+    """Cycle through weather states and emit events on change.
+
+    The initial state is drawn on the first update rather than in the
+    constructor: loaders build nodes before attaching them to their world,
+    so only then does :func:`~nodes.world.world_rng` see a seeded stream.
+    ``current_state`` is ``None`` until then.
+    """
 
     def __init__(
         self,
@@ -20,14 +26,17 @@ class WeatherSystem(SystemNode):
         super().__init__(**kwargs)
         self.states = states or ["sunny", "rainy"]
         self.change_interval = change_interval
-        self.current_state = random.choice(self.states)
+        self.current_state: str | None = None
         self._acc = 0.0
 
     def update(self, dt: float) -> None:
+        rng = world_rng(self)
+        if self.current_state is None:
+            self.current_state = rng.choice(self.states)
         self._acc += dt
         if self._acc >= self.change_interval:
             self._acc -= self.change_interval
-            state = random.choice(self.states)
+            state = rng.choice(self.states)
             if state != self.current_state:
                 self.current_state = state
                 self.emit("weather_changed", {"state": state})
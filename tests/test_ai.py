@@ -3,6 +3,7 @@ from nodes.world import WorldNode
 from nodes.worker import WorkerNode
 from nodes.builder import BuilderNode
 from nodes.building import BuildingNode
+from nodes.road import RoadLayerNode
 from nodes.transform import TransformNode
 from nodes.nation import NationNode
 from nodes.terrain import TerrainNode
@@ -77,9 +78,7 @@ def test_builder_constructs_city_when_idle_far_from_last():
                 positions.append(child.position)
     assert [3, 0] in positions
     road_positions = sorted(
-        child.children[0].position
-        for child in world.children
-        if isinstance(child, BuildingNode) and child.type == "road"
+        [x, y] for x, y in RoadLayerNode.for_root(world).tiles()
     )
     assert road_positions == [[1, 0], [2, 0]]
     assert builder.parent is None
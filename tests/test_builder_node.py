@@ -1,5 +1,6 @@
 from nodes.builder import BuilderNode
 from nodes.building import BuildingNode
+from nodes.road import RoadLayerNode
 from nodes.world import WorldNode
 from nodes.transform import TransformNode
 from nodes.terrain import TerrainNode
@@ -29,9 +30,7 @@ def test_builder_creates_city_and_roads():
 
     # ensure roads connect intermediate tiles
     road_positions = sorted(
-        child.children[0].position
-        for child in world.children
-        if isinstance(child, BuildingNode) and child.type == "road"
+        [x, y] for x, y in RoadLayerNode.for_root(world).tiles()
     )
     assert road_positions == [[1, 0], [2, 0], [3, 0]]
 
@@ -50,9 +49,7 @@ def test_builder_creates_road_without_pathfinder():
     assert isinstance(city, BuildingNode)
 
     road_positions = sorted(
-        child.children[0].position
-        for child in world.children
-        if isinstance(child, BuildingNode) and child.type == "road"
+        [x, y] for x, y in RoadLayerNode.for_root(world).tiles()
     )
     assert road_positions == [[1, 1], [2, 2]]
     assert builder.state == "exploring"
@@ -109,8 +106,37 @@ def test_builder_returns_to_capital_and_leaves_road():
 
     assert builder.parent is None
     road_positions = sorted(
-        child.children[0].position
-        for child in world.children
-        if isinstance(child, BuildingNode) and child.type == "road"
+        [x, y] for x, y in RoadLayerNode.for_root(world).tiles()
     )
     assert road_positions == [[1, 0], [2, 0], [3, 0]]
+
+
+def test_builder_without_influence_radius_builds_on_existing_city():
+    world = WorldNode(name="world")
+    nation = NationNode(parent=world, morale=100, capital_position=[0, 0])
+    nation.add_city(3, 0)
+    last = BuildingNode(parent=nation, type="capital")
+    TransformNode(parent=last, position=[0, 0])
+
+    builder = BuilderNode(parent=nation)
+    city = builder.build_city([3, 0], last)
+
+    # A radius of 0 places no restriction, not even on occupied tiles.
+    assert isinstance(city, BuildingNode)
+    assert nation.cities_positions == [(0.0, 0.0), (3, 0)]
+
+
+def test_builder_with_influence_radius_rejects_existing_city():
+    world = WorldNode(name="world")
+    nation = NationNode(
+        parent=world, morale=100, capital_position=[0, 0], city_influence_radius=1
+    )
+    nation.add_city(3, 0)
+    last = BuildingNode(parent=nation, type="capital")
+    TransformNode(parent=last, position=[0, 0])
+
+    builder = BuilderNode(parent=nation)
+
+    assert builder.build_city([3, 0], last) is None
+    assert builder.state == "exploring"
+    assert nation.cities_positions == [(0.0, 0.0), (3, 0)]
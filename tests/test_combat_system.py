@@ -34,7 +34,7 @@ def test_combat_routes_losing_unit_and_reduces_morale():
 
 
 def test_combat_system_resolves_terrain_by_name():
-    world = WorldNode()
+    world = WorldNode(seed=0)
     terrain = TerrainNode(parent=world, name="map", tiles=[["plain"]])
     cs = CombatSystem(parent=world, terrain="map")
 
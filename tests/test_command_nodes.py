@@ -1,7 +1,7 @@
 from nodes.army import ArmyNode
 from nodes.unit import UnitNode
 from nodes.nation import NationNode
-from nodes.strategist import StrategistNode
+from nodes.strategist import DEFAULT_MAX_REPORTS, StrategistNode
 from nodes.officer import OfficerNode
 from nodes.bodyguard import BodyguardUnitNode
 from nodes.general import GeneralNode
@@ -65,3 +65,37 @@ def test_army_lists_officers():
     army = ArmyNode(goal="advance", size=0)
     officer = OfficerNode(parent=army)
     assert army.get_officers() == [officer]
+
+
+def test_strategist_orders_out_of_order_reports_by_timestamp():
+    strategist = StrategistNode()
+    strategist.emit("enemy_spotted", {"enemy": "b", "timestamp": 100})
+    strategist.emit("enemy_spotted", {"enemy": "a", "timestamp": 30})
+    strategist.emit("enemy_spotted", {"enemy": "c", "timestamp": 50})
+
+    intel = strategist.get_enemy_estimates(max_age_s=60)
+    assert [r["enemy"] for r in intel] == ["c", "b"]
+
+
+def test_strategist_evicts_by_capacity_and_ttl():
+    strategist = StrategistNode(max_reports=3, intel_ttl_s=100)
+    for ts in (0, 10, 20, 30):
+        strategist.emit("enemy_spotted", {"enemy": ts, "timestamp": ts})
+    assert [r["enemy"] for r in strategist.intel_reports] == [10, 20, 30]
+
+    strategist.emit("enemy_spotted", {"enemy": 125, "timestamp": 125})
+    assert [r["enemy"] for r in strategist.intel_reports] == [30, 125]
+
+
+def test_strategist_caps_intel_by_default():
+    strategist = StrategistNode()
+    total = DEFAULT_MAX_REPORTS + 5
+    for ts in range(total):
+        strategist.emit("enemy_spotted", {"enemy": ts, "timestamp": ts})
+    assert len(strategist.intel_reports) == DEFAULT_MAX_REPORTS
+    assert strategist.intel_reports[0]["enemy"] == 5
+
+    unbounded = StrategistNode(max_reports=None)
+    for ts in range(total):
+        unbounded.emit("enemy_spotted", {"enemy": ts, "timestamp": ts})
+    assert len(unbounded.intel_reports) == total
@@ -65,3 +65,35 @@ def test_command_delay_fifo() -> None:
     assert not received
     cmd.update(0.6)
     assert received == ["move", "hold"]
+
+
+def test_command_losses_follow_the_world_seed() -> None:
+    import random
+
+    from nodes.world import WorldNode
+
+    def delivered(seed: int) -> list[int]:
+        world = WorldNode(seed=seed)
+        root = NationNode(morale=100, capital_position=[0, 0], parent=world)
+        # Built detached, as core.loader does, then attached.
+        cmd = CommandSystem(reliability=0.5)
+        root.add_child(cmd)
+        gen = GeneralNode(style="balanced", parent=root)
+        officers = [
+            OfficerNode(parent=ArmyNode(parent=gen, goal="advance", size=0))
+            for _ in range(20)
+        ]
+        received: list[int] = []
+        for i, officer in enumerate(officers):
+            officer.on_event(
+                "order_received", lambda _o, _e, _p, i=i: received.append(i)
+            )
+        gen.issue_orders([{"order_type": "hold", "recipient_group": "officers"}])
+        cmd.update(1.0)
+        return received
+
+    random.seed(1)
+    first = delivered(3)
+    random.seed(2)
+    assert delivered(3) == first
+    assert 0 < len(first) < 20
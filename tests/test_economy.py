@@ -1,7 +1,7 @@
 import pytest
 
 from nodes.world import WorldNode
-from nodes.resource import ResourceNode
+from nodes.resource import UNBOUNDED, ResourceNode
 from systems.economy import EconomySystem
 
 
@@ -58,3 +58,24 @@ def test_transfer_raises_when_destination_full():
     # quantities remain unchanged on failure
     assert src.quantity == 5
     assert dst.quantity == 0
+
+
+def test_unbounded_stock_accepts_any_amount():
+    stock = ResourceNode(kind="gold")
+
+    assert stock.max_quantity == 0
+    assert stock.add(10**9) == 10**9
+    assert stock.add(UNBOUNDED) == UNBOUNDED - 10**9
+    assert stock.quantity == UNBOUNDED
+
+
+def test_economy_rejects_negative_amounts():
+    world = WorldNode()
+    econ = EconomySystem(parent=world)
+    src = ResourceNode(kind="wood", quantity=5, parent=world)
+
+    with pytest.raises(ValueError):
+        econ.produce(src, "wood", -1)
+    with pytest.raises(ValueError):
+        econ.transfer(src, None, "wood", -1)
+    assert src.quantity == 5
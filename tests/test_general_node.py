@@ -1,3 +1,4 @@
+import nodes.general as general_module
 from nodes.general import GeneralNode
 from nodes.army import ArmyNode
 from nodes.nation import NationNode
@@ -15,6 +16,9 @@ def test_general_records_style_and_reports():
     assert general.reports[0]["sector"] == 1
     assert general.get_armies() == [army]
 
+    StrategistNode(parent=general)
+    assert general.get_armies() == [army]
+
 
 def test_general_ai_changes_army_goal_based_on_intel():
     nation = NationNode(name="nation", morale=100, capital_position=[0, 0])
@@ -46,3 +50,17 @@ def test_general_attempts_flank_with_probability():
     general.flank_success_chance = 0.0
     assert general.attempt_flank(other_army) is False
     assert other_army.goal == "advance"
+
+
+def test_general_best_action_is_memoised_per_parameters():
+    general = GeneralNode(style="defensive", caution_level=0.9, intel_confidence=0.2)
+    goal = general._best_action()
+    assert goal in {"hold", "retreat"}
+
+    cache = general_module._best_action
+    hits = cache.cache_info().hits
+    other = GeneralNode(style="defensive", caution_level=0.9, intel_confidence=0.2)
+    assert other._best_action() == goal
+    assert cache.cache_info().hits == hits + 1
+    # The memo is bounded, not a table growing with every parameter set.
+    assert cache.cache_info().maxsize is not None
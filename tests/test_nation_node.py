@@ -1,4 +1,6 @@
 from core.simnode import SimNode
+from nodes.army import ArmyNode
+from nodes.general import GeneralNode
 from nodes.nation import NationNode
 
 
@@ -8,6 +10,10 @@ def test_morale_change_emits_event():
     nation.on_event("moral_changed", lambda _o, _e, payload: events.append(payload))
 
     nation.change_morale(-10)
+    assert nation.morale == 90
+    assert events == []
+
+    nation.update(0.0)
 
     assert nation.morale == 90
     assert events[0]["previous"] == 100
@@ -15,6 +21,22 @@ def test_morale_change_emits_event():
     assert events[0]["delta"] == -10
 
 
+def test_morale_changes_are_batched_per_tick():
+    nation = NationNode(morale=100, capital_position=[0, 0])
+    events: list[dict] = []
+    nation.on_event("moral_changed", lambda _o, _e, payload: events.append(payload))
+
+    nation.change_morale(-3)
+    nation.change_morale(-2)
+    nation.update(1.0)
+    nation.update(1.0)
+
+    assert len(events) == 1
+    assert events[0]["previous"] == 100
+    assert events[0]["morale"] == 95
+    assert events[0]["delta"] == -5
+
+
 def test_capital_capture_emits_event():
     nation = NationNode(morale=50, capital_position=[5, 5])
     events: list[dict] = []
@@ -26,19 +48,57 @@ def test_capital_capture_emits_event():
 
 
 def test_references_generals_and_armies():
+    army = ArmyNode(name="army", goal="hold")
+    general = GeneralNode(name="general", style="balanced")
+    general.add_child(army)
+
+    nation = NationNode(morale=100, capital_position=[0, 0])
+    nation.add_child(general)
+
+    assert nation.get_generals() == [general]
+    assert nation.get_armies() == [army]
+
+    # Plain nodes are not mistaken for generals or armies.
+    SimNode(name="other", parent=nation)
+    assert nation.get_generals() == [general]
+
+    general.remove_child(army)
+    assert nation.get_armies() == []
+
+
+def test_look_alike_classes_are_not_generals_or_armies():
+    # Matching is by class identity; same-named stand-ins used to match by
+    # name and no longer do.
     class GeneralNode(SimNode):
         pass
 
     class ArmyNode(SimNode):
         pass
 
-    army = ArmyNode(name="army")
     general = GeneralNode(name="general")
-    general.add_child(army)
-
+    ArmyNode(name="army", parent=general)
     nation = NationNode(morale=100, capital_position=[0, 0])
     nation.add_child(general)
 
-    assert nation.get_generals() == [general]
-    assert nation.get_armies() == [army]
+    assert nation.get_generals() == []
+    assert nation.get_armies() == []
+
+
+def test_add_city_ignores_duplicates():
+    nation = NationNode(morale=100, capital_position=[0, 0])
+
+    assert nation.has_city(0, 0)
+    assert nation.add_city(3, 4) is True
+    assert nation.add_city(3, 4) is False
+    assert nation.cities_positions == [(0.0, 0.0), (3, 4)]
+
+
+def test_get_armies_skips_subtrees_that_cannot_hold_armies():
+    nation = NationNode(morale=100, capital_position=[0, 0])
+    general = GeneralNode(parent=nation, style="balanced")
+    army = ArmyNode(parent=general, goal="hold")
+    direct = ArmyNode(parent=nation, goal="advance")
+    other = SimNode(name="other", parent=nation)
+    ArmyNode(parent=other, goal="hold")
 
+    assert nation.get_armies() == [direct, army]
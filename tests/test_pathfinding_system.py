@@ -42,3 +42,50 @@ def test_resolves_terrain_by_name():
     path = pf.find_path((0, 0), (1, 0))
     assert pf.terrain is terrain
     assert path == [(0, 0), (1, 0)]
+
+
+def test_find_nearest_returns_cheapest_goal_path():
+    tiles = [["plain"] * 5 for _ in range(3)]
+    terrain = TerrainNode(tiles=tiles, obstacles=[[1, 0], [1, 1]])
+    pf = PathfindingSystem(terrain=terrain)
+
+    path = pf.find_nearest((0, 0), [(2, 0), (0, 2), (9, 9)])
+    assert path == [(0, 0), (0, 1), (0, 2)]
+    assert pf.find_nearest((0, 0), [(4, 0)], max_cost=3.0) == []
+    assert pf.find_nearest((0, 0), [(0, 0)]) == [(0, 0)]
+
+
+def test_find_nearest_weighs_terrain_over_tile_count():
+    # Two tiles of swamp (cost 2 each) to the right, three of plain below.
+    tiles = [
+        ["plain", "swamp", "swamp"],
+        ["plain", "water", "water"],
+        ["plain", "water", "water"],
+        ["plain", "water", "water"],
+    ]
+    terrain = TerrainNode(tiles=tiles, obstacles=[[1, 1], [1, 2], [1, 3]])
+    pf = PathfindingSystem(terrain=terrain)
+
+    path = pf.find_nearest((0, 0), [(2, 0), (0, 3)])
+    assert path == [(0, 0), (0, 1), (0, 2), (0, 3)]
+
+
+def test_path_grid_step_costs_follow_modifier_updates():
+    terrain = TerrainNode(tiles=[["plain", "forest"]])
+    costs = terrain.path_grid()[3]
+    assert terrain.path_grid()[3] is costs
+
+    terrain.update_modifiers(speed={"forest": 0.0})
+    grid, _mask, _offsets, costs = terrain.path_grid()
+    assert costs[grid[1]] == float("inf")
+    assert PathfindingSystem(terrain=terrain).find_path((0, 0), (1, 0)) == []
+
+
+def test_find_path_rejects_endpoints_outside_the_terrain():
+    terrain = TerrainNode(tiles=[["plain"] * 3])
+    pf = PathfindingSystem(terrain=terrain)
+
+    assert pf.find_path((0, 0), (5, 0)) == []
+    assert pf.find_path((-1, 0), (2, 0)) == []
+    # Even a zero-length request off the map yields no path.
+    assert pf.find_path((7, 7), (7, 7)) == []
@@ -0,0 +1,22 @@
+import importlib
+
+from core import plugins
+from core.plugins import get_node_type, load_plugins
+
+
+def test_load_plugins_imports_each_module_once(monkeypatch):
+    calls = []
+    real_import = importlib.import_module
+
+    def _import(name):
+        calls.append(name)
+        return real_import(name)
+
+    monkeypatch.setattr(plugins, "_loaded", set())
+    monkeypatch.setattr(plugins.importlib, "import_module", _import)
+
+    load_plugins(["nodes.world", "nodes.terrain"])
+    load_plugins(["nodes.terrain", "nodes.unit"])
+
+    assert calls == ["nodes.world", "nodes.terrain", "nodes.unit"]
+    assert get_node_type("TerrainNode").__name__ == "TerrainNode"
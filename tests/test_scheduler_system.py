@@ -29,3 +29,15 @@ def test_scheduler_updates_nodes_at_intervals():
 
     assert fast.count == 5
     assert slow.count == 2
+
+
+def test_scheduler_reports_interval_of_scheduled_nodes():
+    scheduler = SchedulerSystem()
+    node = DummyNode()
+
+    assert scheduler.interval_of(node) is None
+    scheduler.schedule(node, interval=2.0)
+    assert scheduler.interval_of(node) == 2.0
+    scheduler.unschedule(node)
+    assert scheduler.interval_of(node) is None
+    assert scheduler._tasks == []
@@ -2,22 +2,76 @@ from __future__ import annotations
 
 import random
 
-from nodes.world import WorldNode
+from core.simnode import SimNode
+from nodes.world import WorldNode, world_rng
 
 
 def test_world_seed_reproducibility() -> None:
-    """WorldNode seeds the global RNG for deterministic simulations."""
+    """Seeded worlds own a deterministic random stream."""
+    w1 = WorldNode(name="w1", seed=123)
+    w2 = WorldNode(name="w2", seed=123)
+    seq1 = [w1.rng.random() for _ in range(3)]
+    seq2 = [w2.rng.random() for _ in range(3)]
+    assert seq1 == seq2
+
+    w3 = WorldNode(name="w3", seed=456)
+    seq3 = [w3.rng.random() for _ in range(3)]
+    assert seq1 != seq3
+
+
+def test_seeded_worlds_leave_global_rng_alone() -> None:
     state = random.getstate()
     try:
-        WorldNode(name="w1", seed=123)
-        seq1 = [random.random() for _ in range(3)]
-        WorldNode(name="w2", seed=123)
-        seq2 = [random.random() for _ in range(3)]
-        assert seq1 == seq2
-
-        WorldNode(name="w3", seed=456)
-        seq3 = [random.random() for _ in range(3)]
-        assert seq1 != seq3
+        random.seed(7)
+        expected = [random.random() for _ in range(3)]
+        random.seed(7)
+        world = WorldNode(seed=123)
+        world.rng.random()
+        assert [random.random() for _ in range(3)] == expected
+        assert "rng" not in world.serialize()["state"]
     finally:
         random.setstate(state)
 
+
+def test_world_rng_resolves_from_any_descendant() -> None:
+    world = WorldNode(seed=1)
+    child = SimNode(parent=SimNode(parent=world))
+
+    assert world_rng(child) is world.rng
+    assert world_rng(SimNode()) is random
+    assert WorldNode().rng is random
+
+
+def test_seeded_world_generates_the_same_terrain() -> None:
+    from simulation.war.terrain_setup import generate_terrain
+
+    params = {
+        "rivers": [{"start": [0, 5], "end": [31, 20]}],
+        "lakes": [{"center": [16, 12], "radius": 4}],
+        "forests": {"total_area_pct": 10, "clusters": 2},
+        "mountains": {"total_area_pct": 5},
+        "swamp_desert": {"swamp_pct": 3, "desert_pct": 3},
+    }
+    first = generate_terrain(32, 24, params, WorldNode(seed=1).rng)
+    second = generate_terrain(32, 24, params, WorldNode(seed=1).rng)
+    assert first == second
+
+
+def test_weather_built_before_attachment_uses_the_world_stream() -> None:
+    from systems.weather import WeatherSystem
+
+    def run(seed: int) -> list[str]:
+        # Built detached, as core.loader does, then attached to the world.
+        weather = WeatherSystem(states=list("abcdefgh"), change_interval=1.0)
+        world = WorldNode(seed=seed)
+        world.add_child(weather)
+        states = []
+        for _ in range(10):
+            world.update(1.0)
+            states.append(weather.current_state)
+        return states
+
+    random.seed(99)
+    states = run(5)
+    random.seed(1234)
+    assert run(5) == states
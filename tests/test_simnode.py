@@ -101,3 +101,94 @@ def test_add_child_during_update():
 
     parent.update(0.1)
     assert child.calls == 1
+
+
+def test_serialize_includes_slot_attributes():
+    from nodes.building import BuildingNode
+
+    building = BuildingNode(name="b", type="farm", capacity=3)
+    assert not hasattr(building, "__dict__")
+    state = building.serialize()["state"]
+    assert state["type"] == "farm"
+    assert state["capacity"] == 3
+    assert "children" not in state
+
+
+def test_serialize_skips_transient_attributes():
+    class Cached(SimNode):
+        _TRANSIENT_ATTRS = SimNode._TRANSIENT_ATTRS | {"_cache"}
+
+        def __init__(self, **kwargs) -> None:
+            super().__init__(**kwargs)
+            self.size = 3
+            self._cache = object()
+
+    state = Cached().serialize()["state"]
+    assert state["size"] == 3
+    assert "_cache" not in state
+
+
+def test_children_of_type_tracks_add_and_remove():
+    class Leaf(SimNode):
+        pass
+
+    parent = SimNode(name="parent")
+    leaf = Leaf(name="leaf", parent=parent)
+    plain = SimNode(name="plain", parent=parent)
+
+    assert parent.get_children_of_type(Leaf) == [leaf]
+    assert parent.get_children_of_type(SimNode) == [plain]
+
+    assert parent.get_child_of_type(Leaf) is leaf
+
+    parent.remove_child(leaf)
+    assert parent.get_children_of_type(Leaf) == []
+    assert parent.get_child_of_type(Leaf) is None
+
+
+def test_add_children_matches_add_child():
+    class Leaf(SimNode):
+        pass
+
+    parent = SimNode(name="parent")
+    first = SimNode(name="first", parent=parent)
+    batch = [Leaf(name="a"), SimNode(name="b"), Leaf(name="c")]
+    parent.add_children(batch)
+
+    assert parent.children == [first, *batch]
+    assert all(node.parent is parent for node in batch)
+    assert parent.get_children_of_type(Leaf) == [batch[0], batch[2]]
+    assert parent.get_children_of_type(SimNode) == [first, batch[1]]
+
+
+def test_slotted_node_types_have_no_instance_dict():
+    from nodes.army import ArmyNode
+    from nodes.bodyguard import BodyguardUnitNode
+    from nodes.builder import BuilderNode
+    from nodes.nation import NationNode
+    from nodes.officer import OfficerNode
+    from nodes.resource import ResourceNode
+    from nodes.strategist import StrategistNode
+    from nodes.terrain import TerrainNode
+    from nodes.transform import TransformNode
+    from nodes.unit import UnitNode
+    from nodes.worker import WorkerNode
+    from nodes.world import WorldNode
+
+    nodes = [
+        ArmyNode(goal="advance"),
+        BodyguardUnitNode(),
+        BuilderNode(build_duration=1.0),
+        NationNode(morale=100, capital_position=[0, 0]),
+        OfficerNode(),
+        ResourceNode(kind="wood"),
+        StrategistNode(),
+        TerrainNode(tiles=[["plain"]]),
+        TransformNode(),
+        UnitNode(),
+        WorkerNode(),
+        WorldNode(),
+    ]
+    for node in nodes:
+        assert not hasattr(node, "__dict__"), type(node).__name__
+        node.serialize()
@@ -132,3 +132,20 @@ def test_swamp_and_desert() -> None:
     assert TILE_CODES["desert"] in flat
     assert obstacles == set()
 
+
+
+def test_swamp_desert_only_replaces_plain() -> None:
+    random.seed(5)
+    tiles = generate_base(20, 20, fill="forest")
+    tiles[10][:] = bytearray([TILE_CODES["plain"]]) * 20
+    tiles, _ = place_swamp_desert(
+        tiles,
+        swamp_pct=100,
+        desert_pct=0,
+        clumpiness=1.0,
+        obstacles_set=set(),
+    )
+    for y, row in enumerate(tiles):
+        allowed = {TILE_CODES["plain"], TILE_CODES["swamp"]} if y == 10 else {TILE_CODES["forest"]}
+        assert set(row) <= allowed
+    assert TILE_CODES["swamp"] in tiles[10]
@@ -1,3 +1,5 @@
+import pytest
+
 from nodes.terrain import TerrainNode
 
 
@@ -7,6 +9,11 @@ def test_tile_lookup_and_modifiers():
 
     assert terrain.get_tile(0, 0) == "plain"
     assert terrain.get_tile(1, 0) == "forest"
+    assert terrain.get_tile(2, 0) is None
+    assert [terrain.get_tile_unchecked(*n) for n in terrain.get_neighbors(0, 0)] == [
+        "forest",
+        "hill",
+    ]
     assert terrain.get_speed_modifier(1, 0) == 0.7
     assert terrain.get_combat_bonus(0, 1) == 2
 
@@ -37,3 +44,103 @@ def test_neighbor_lookup_square_and_hex():
         (0, 2),
         (1, 2),
     }
+    assert list(hexagon.iter_neighbors(0, 0)) == hexagon.get_neighbors(0, 0)
+
+
+def test_tiles_are_flat_and_support_batch_queries():
+    terrain = TerrainNode(tiles=[["plain", "forest"], ["hill", "swamp"]])
+
+    assert bytes(terrain.tiles[1]) == bytes([2, 5])
+    assert terrain.get_tile_codes([1, 0, 5], [0, 1, 0]) == [1, 2, None]
+    assert terrain.get_speed_modifiers([1, 1, -1], [0, 1, 0]) == [0.7, 0.5, 1.0]
+    assert terrain.get_combat_bonuses([0, 0, 9], [0, 1, 0]) == [0, 2, 0]
+
+    clone = TerrainNode(tiles=[[0]])
+    clone.set_tile_bytes(terrain.tile_bytes(), terrain.width)
+    assert [bytes(row) for row in clone.tiles] == [bytes(row) for row in terrain.tiles]
+
+    terrain.tiles = [[0, 0, 0]]
+    assert (terrain.width, terrain.height) == (3, 1)
+    assert terrain.get_tile(2, 0) == "plain"
+
+
+def test_obstacle_mask_follows_obstacles_and_tiles():
+    terrain = TerrainNode(tiles=[["plain"] * 3], obstacles=[[1, 0], [5, 5]])
+
+    assert terrain.is_obstacle(1, 0)
+    assert not terrain.is_obstacle(0, 0)
+    assert terrain.is_obstacle(5, 5)
+
+    terrain.obstacles = {(2, 0)}
+    assert not terrain.is_obstacle(1, 0)
+    assert terrain.is_obstacle(2, 0)
+
+    terrain.tiles = [["plain"] * 3 for _ in range(2)]
+    assert terrain.is_obstacle(2, 0)
+    assert not terrain.is_obstacle(2, 1)
+
+
+def test_update_modifiers_accepts_names_and_codes():
+    terrain = TerrainNode(tiles=[["plain", "water"]])
+
+    terrain.update_modifiers(speed={"water": 0.25}, combat={3: -5})
+
+    assert terrain.get_speed_modifier(1, 0) == 0.25
+    assert terrain.get_combat_bonus(1, 0) == -5
+    assert terrain.speed_modifiers[3] == 0.25
+    assert terrain.serialize()["state"]["speed_modifiers"]["water"] == 0.25
+
+
+def test_altitude_map_is_flat_with_batch_queries():
+    terrain = TerrainNode(
+        tiles=[["plain"] * 2 for _ in range(2)],
+        altitude_map=[[0.0, 0.5], [0.25, 1.0]],
+    )
+
+    assert terrain.get_altitude(1, 0) == 0.5
+    assert terrain.get_altitude(2, 0) is None
+    assert terrain.get_altitudes([0, 1, 5], [1, 1, 0]) == [0.25, 1.0, None]
+    assert terrain.altitude_map[1].tolist() == [0.25, 1.0]
+
+    terrain.altitude_map = None
+    assert terrain.get_altitude(0, 0) is None
+
+
+def test_altitude_map_keeps_double_precision():
+    terrain = TerrainNode(tiles=[["plain"] * 2], altitude_map=[[0.1, 0.7]])
+    assert terrain.altitude_map[0].tolist() == [0.1, 0.7]
+
+    terrain.altitude_map = [[0.3, 0.9]]
+    assert terrain.get_altitudes([0, 1], [0, 0]) == [0.3, 0.9]
+
+
+def test_same_shape_altitude_map_reuses_buffer():
+    terrain = TerrainNode(
+        tiles=[["plain"] * 2 for _ in range(2)],
+        altitude_map=[[0.0, 0.5], [0.25, 1.0]],
+    )
+    row = terrain.altitude_map[1]
+
+    terrain.altitude_map = [[1.0, 0.75], [0.5, 0.0]]
+    assert terrain.altitude_map[1] is row
+    assert row.tolist() == [0.5, 0.0]
+    assert terrain.get_altitude(1, 0) == 0.75
+
+    terrain.altitude_map = [[0.5]]
+    assert terrain.get_altitudes([0, 1], [0, 0]) == [0.5, None]
+
+
+def test_rows_are_read_only_and_set_tile_bumps_version():
+    terrain = TerrainNode(tiles=[["plain", "plain"]])
+    events = []
+    terrain.on_event("terrain_dirty", lambda _o, _e, p: events.append(p))
+    version = terrain.version
+
+    with pytest.raises(TypeError):
+        terrain.tiles[0][1] = 1
+
+    terrain.set_tile(1, 0, "forest")
+
+    assert terrain.get_tile(1, 0) == "forest"
+    assert terrain.version == version + 1
+    assert [(e["x"], e["y"]) for e in events] == [(1, 0)]
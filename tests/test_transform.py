@@ -5,3 +5,10 @@ def test_velocity_updates_position():
     t = TransformNode(position=[0.0, 0.0], velocity=[1.0, 0.5])
     t.update(2.0)
     assert t.position == [2.0, 1.0]
+
+
+def test_zero_velocity_leaves_position_untouched():
+    position = [3.0, 4.0]
+    t = TransformNode(position=position)
+    t.update(1.0)
+    assert t.position is position and position == [3.0, 4.0]
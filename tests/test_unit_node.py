@@ -36,6 +36,29 @@ def test_unit_retreats_when_morale_low():
     assert unit.target == [0, 0]
 
 
+def test_home_position_follows_reparenting():
+    root = SimNode("root")
+    first = NationNode(parent=root, morale=100, capital_position=[0, 0])
+    second = NationNode(parent=root, morale=100, capital_position=[9, 9])
+    army = ArmyNode(parent=first, goal="advance")
+    unit = UnitNode(parent=army)
+
+    assert unit._get_home_position() == [0, 0]
+    assert "_home_nation" not in unit.serialize()["state"]
+
+    army.remove_child(unit)
+    second.add_child(unit)
+    assert unit._get_home_position() == [9, 9]
+
+    # Moving an ancestor rather than the unit itself is noticed too.
+    second.remove_child(unit)
+    army.add_child(unit)
+    assert unit._get_home_position() == [0, 0]
+    first.remove_child(army)
+    second.add_child(army)
+    assert unit._get_home_position() == [9, 9]
+
+
 def test_order_acknowledgement_and_completion():
     root = SimNode("root")
     unit = UnitNode(parent=root)
@@ -14,3 +14,97 @@ def test_load_sim_params_applies_overrides_and_defaults(tmp_path):
 def test_load_sim_params_missing_file(tmp_path):
     params = war_loader.load_sim_params(str(tmp_path / "missing.json"))
     assert params == DEFAULT_SIM_PARAMS
+
+
+def test_terrain_cache_is_opt_in_keyed_and_bypassable(tmp_path, monkeypatch):
+    from nodes.terrain import TerrainNode
+    from nodes.world import WorldNode
+
+    cache = tmp_path / "terrain_cache.pkl"
+    monkeypatch.setitem(war_loader.sim_params, "terrain", {})
+    monkeypatch.setattr(war_loader, "_config_file", None)
+    world = WorldNode(width=12, height=8)
+    terrain = TerrainNode(tiles=[["plain"] * 12 for _ in range(8)], parent=world)
+
+    monkeypatch.delenv("WAR_TERRAIN_CACHE", raising=False)
+    war_loader.reset_world(world)
+    assert not cache.exists()
+
+    monkeypatch.setenv("WAR_TERRAIN_CACHE", str(cache))
+    war_loader.reset_world(world)
+    assert cache.exists()
+    assert not list(tmp_path.glob("*.tmp"))
+    generated = terrain.tile_bytes()
+
+    terrain.set_tile(0, 0, "water")
+    war_loader.reset_world(world)
+    assert terrain.tile_bytes() == generated
+
+    # Other terrain settings produce a different key, so the map is rebuilt.
+    monkeypatch.setitem(war_loader.sim_params, "terrain", {"lakes": []})
+    assert not war_loader.load_terrain_cache(terrain, str(cache), war_loader.terrain_cache_key(world))
+    assert war_loader.sim_params["terrain"] == {"lakes": []}
+
+
+def test_terrain_cache_ignores_stale_or_corrupt_files(tmp_path, monkeypatch):
+    import os
+
+    from nodes.terrain import TerrainNode
+    from nodes.world import WorldNode
+
+    config = tmp_path / "config.json"
+    config.write_text("{}")
+    cache = tmp_path / "terrain_cache.pkl"
+    monkeypatch.setitem(war_loader.sim_params, "terrain", {})
+    monkeypatch.setattr(war_loader, "_config_file", str(config))
+    world = WorldNode(width=6, height=4)
+    terrain = TerrainNode(tiles=[["plain"] * 6 for _ in range(4)], parent=world)
+    key = war_loader.terrain_cache_key(world)
+
+    war_loader.save_terrain_cache(terrain, str(cache), key)
+    assert war_loader.load_terrain_cache(terrain, str(cache), key)
+
+    stamp = os.path.getmtime(cache)
+    os.utime(config, (stamp + 10, stamp + 10))
+    assert not war_loader.load_terrain_cache(terrain, str(cache), key)
+
+    cache.write_bytes(b"\x80truncated")
+    os.utime(cache, (stamp + 20, stamp + 20))
+    assert not war_loader.load_terrain_cache(terrain, str(cache), key)
+
+
+def test_reset_world_installs_terrain_generated_in_worker(monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+
+    from nodes.terrain import TerrainNode
+    from nodes.world import WorldNode
+    from simulation.war.terrain_setup import generate_terrain
+
+    monkeypatch.delenv("WAR_TERRAIN_CACHE", raising=False)
+    world = WorldNode(width=16, height=12)
+    terrain = TerrainNode(tiles=[["plain"] * 16 for _ in range(12)], parent=world)
+    params = {"lakes": [{"center": (8, 6), "radius": 3, "irregularity": 0.0}]}
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        generated = pool.submit(generate_terrain, 16, 12, params).result()
+    war_loader.reset_world(world, generated=generated)
+
+    assert terrain.tile_bytes() == b"".join(generated[0])
+    assert terrain.obstacles == generated[1]
+    assert terrain.is_obstacle(8, 6)
+
+
+def test_setup_world_generates_terrain_unless_disabled(tmp_path, monkeypatch):
+    settings = tmp_path / "settings.json"
+    settings.write_text(json.dumps({"parameters": {"map_width": 24, "map_height": 16}}))
+    monkeypatch.setattr(war_loader, "sim_params", dict(war_loader.sim_params))
+    monkeypatch.setattr(war_loader, "_config_file", None)
+    war_loader.load_plugins_for_war()
+
+    world, terrain, _ = war_loader.setup_world(settings_file=str(settings))
+    assert (terrain.width, terrain.height) == (24, 16)
+
+    world, terrain, _ = war_loader.setup_world(
+        settings_file=str(settings), generate_terrain=False
+    )
+    assert (terrain.width, terrain.height) != (24, 16)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from core.simnode import SimNode
+from nodes.resource import ResourceNode
+from nodes.terrain import TerrainNode
+from nodes.transform import TransformNode
 from nodes.worker import WorkerNode
 from nodes.world import WorldNode
+from systems.pathfinding import PathfindingSystem
 from systems.scheduler import SchedulerSystem
 
 
@@ -38,3 +43,67 @@ def test_worker_scheduling_and_state():
 
     world.update(1.0)
     assert worker.count == 2
+
+
+def test_worker_system_lookup_follows_tree_changes():
+    world = WorldNode(name="world")
+    scheduler = SchedulerSystem(parent=world)
+    worker = TestWorker(parent=world)
+
+    assert worker._find_scheduler() is scheduler
+    assert worker._find_scheduler() is scheduler
+
+    world.remove_child(scheduler)
+    assert worker._find_scheduler() is None
+
+    other = WorldNode(name="other")
+    other_scheduler = SchedulerSystem(parent=other)
+    world.remove_child(worker)
+    other.add_child(worker)
+    assert worker._find_root() is other
+    assert worker._find_scheduler() is other_scheduler
+    assert "_system_cache" not in worker.serialize()["state"]
+
+
+def test_worker_root_lookup_follows_ancestor_reparenting():
+    world = WorldNode(name="world")
+    group = SimNode(parent=world)
+    worker = TestWorker(parent=group)
+    assert worker._find_root() is world
+
+    # The worker keeps its parent; only an ancestor moves.
+    other = WorldNode(name="other")
+    other_scheduler = SchedulerSystem(parent=other)
+    world.remove_child(group)
+    assert worker._find_root() is group
+    other.add_child(group)
+    assert worker._find_root() is other
+    assert worker._find_scheduler() is other_scheduler
+
+
+def test_iter_resources_walks_tree_depth_first():
+    world = WorldNode(name="world")
+    a = ResourceNode(kind="wood", name="a", parent=world)
+    ResourceNode(kind="wood", name="b", parent=a)
+    group = SimNode(parent=world)
+    ResourceNode(kind="stone", name="c", parent=group)
+    ResourceNode(kind="grain", name="d", parent=world)
+    worker = TestWorker(parent=world)
+
+    assert [r.name for r in worker._iter_resources(world)] == ["a", "b", "c", "d"]
+
+
+def test_find_task_targets_nearest_resource():
+    world = WorldNode()
+    terrain = TerrainNode(tiles=[["plain"] * 40 for _ in range(3)], parent=world)
+    PathfindingSystem(parent=world, terrain=terrain)
+    for x in (35, 3):
+        res = ResourceNode(kind="wood", parent=world)
+        TransformNode(parent=res, position=[float(x), 0.0])
+    worker = WorkerNode(parent=world)
+    TransformNode(parent=worker, position=[0.0, 0.0])
+
+    assert worker._resource_tiles() == {(3, 0), (35, 0)}
+    assert worker.find_task()
+    assert worker.target == [3, 0]
+    assert worker.state == "moving"
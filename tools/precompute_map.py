@@ -2,32 +2,29 @@
 from __future__ import annotations
 
 import os
-import pickle
 import sys
 
 # Allow running as a script from the repository root
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from simulation.war.war_loader import load_plugins_for_war, setup_world, sim_params
-from simulation.war.terrain_setup import terrain_regen
+from simulation.war.war_loader import (
+    load_plugins_for_war,
+    save_terrain_cache,
+    setup_world,
+    terrain_cache_key,
+)
 
 
 def main(path: str = "terrain_cache.pkl") -> None:
-    """Generate terrain and store it in *path*."""
+    """Generate terrain and store it in *path*.
+
+    Launch the viewer with ``WAR_TERRAIN_CACHE`` pointing at *path* (or
+    ``run_war.py --terrain-cache``) to reuse it.
+    """
 
     load_plugins_for_war()
     world, terrain, _ = setup_world()
-    terrain_regen(world, sim_params["terrain"])
-    data = {
-        "tiles": [bytes(row) for row in terrain.tiles],
-        "obstacles": list(terrain.obstacles),
-        "altitude_map": terrain.altitude_map,
-        "speed_modifiers": terrain.speed_modifiers,
-        "combat_bonuses": terrain.combat_bonuses,
-        "params": sim_params["terrain"],
-    }
-    with open(path, "wb") as fh:
-        pickle.dump(data, fh)
+    save_terrain_cache(terrain, path, terrain_cache_key(world))
     print(f"Terrain cache written to {path}")
 
 
@@ -7,11 +7,17 @@ Every function returns both the mutated ``tiles`` structure and an
 ``obstacles`` set describing impassable coordinates. The implementation is
 light‑weight and intentionally simple; it aims to offer varied landscapes
 without adding heavy dependencies.
+
+The randomised helpers draw from an optional ``rng`` (a
+:class:`random.Random`, usually the world's :attr:`~nodes.world.WorldNode.rng`)
+and fall back to the global :mod:`random` module, so a seeded world always
+produces the same map.
 """
 
 from __future__ import annotations
 
 import random
+from itertools import repeat
 from typing import List, Sequence, Set, Tuple
 
 from core.terrain import TILE_CODES
@@ -42,6 +48,7 @@ def carve_river(
     width_max: int,
     meander: float,
     obstacles_set: Set[Coord],
+    rng: random.Random | None = None,
 ) -> Tuple[TileGrid, Set[Coord]]:
     """Carve a river from ``start`` to ``end`` mutating ``tiles``.
 
@@ -52,28 +59,33 @@ def carve_river(
 
     width = len(tiles[0])
     height = len(tiles)
+    rng = rng or random
     sx, sy = start
     ex, ey = end
+    water = bytes([TILE_CODES["water"]])
     length = max(abs(ex - sx), abs(ey - sy))
     for i in range(length + 1):
         t = i / length if length else 0
         x = sx + (ex - sx) * t
         y = sy + (ey - sy) * t
         # Apply perpendicular random offset for meandering
-        off = (random.random() - 0.5) * 2 * meander * length
+        off = (rng.random() - 0.5) * 2 * meander * length
         if abs(ex - sx) >= abs(ey - sy):
             y += off
         else:
             x += off
         cx, cy = int(round(x)), int(round(y))
-        river_width = random.randint(width_min, width_max)
+        river_width = rng.randint(width_min, width_max)
         half = river_width // 2
-        for dx in range(-half, half + 1):
-            for dy in range(-half, half + 1):
-                px, py = cx + dx, cy + dy
-                if 0 <= px < width and 0 <= py < height:
-                    tiles[py][px] = TILE_CODES["water"]
-                    obstacles_set.add((px, py))
+        x0 = max(0, cx - half)
+        x1 = min(width, cx + half + 1)
+        if x0 >= x1:
+            continue
+        span = water * (x1 - x0)
+        xs = range(x0, x1)
+        for py in range(max(0, cy - half), min(height, cy + half + 1)):
+            tiles[py][x0:x1] = span
+            obstacles_set.update(zip(xs, repeat(py)))
     return tiles, obstacles_set
 
 
@@ -85,20 +97,31 @@ def place_lake(
     radius: int,
     irregularity: float,
     obstacles_set: Set[Coord],
+    rng: random.Random | None = None,
 ) -> Tuple[TileGrid, Set[Coord]]:
     """Place a roughly circular lake around ``center``."""
 
     width = len(tiles[0])
     height = len(tiles)
+    rng = rng or random
     cx, cy = center
-    for y in range(cy - radius, cy + radius + 1):
-        for x in range(cx - radius, cx + radius + 1):
-            if 0 <= x < width and 0 <= y < height:
-                dist = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
-                jitter = random.uniform(-irregularity, irregularity) * radius
-                if dist <= radius + jitter:
-                    tiles[y][x] = TILE_CODES["water"]
-                    obstacles_set.add((x, y))
+    # ``rng.uniform(-irregularity, irregularity)`` spelled out around a
+    # bound ``rng.random`` to save a call per tile.
+    rand = rng.random
+    span = 2 * irregularity
+    water = TILE_CODES["water"]
+    # Only in-bounds tiles draw a jitter value, so clipping the ranges up
+    # front keeps the random sequence unchanged.
+    xs = range(max(0, cx - radius), min(width, cx + radius + 1))
+    for y in range(max(0, cy - radius), min(height, cy + radius + 1)):
+        row = tiles[y]
+        dy2 = (y - cy) ** 2
+        for x in xs:
+            # Compare squared distances to skip a square root per tile.
+            reach = radius + (-irregularity + span * rand()) * radius
+            if reach >= 0 and (x - cx) ** 2 + dy2 <= reach * reach:
+                row[x] = water
+                obstacles_set.add((x, y))
     return tiles, obstacles_set
 
 
@@ -110,6 +133,7 @@ def place_forest(
     clusters: int,
     cluster_spread: float,
     obstacles_set: Set[Coord],
+    rng: random.Random | None = None,
 ) -> Tuple[TileGrid, Set[Coord]]:
     """Place groups of forest tiles forming contiguous patches.
 
@@ -122,6 +146,7 @@ def place_forest(
 
     width = len(tiles[0])
     height = len(tiles)
+    rng = rng or random
     total = int(width * height * total_area_pct / 100)
     if total <= 0:
         return tiles, obstacles_set
@@ -130,10 +155,10 @@ def place_forest(
     tiles_per_cluster = max(1, total // cluster_count)
     code = TILE_CODES["forest"]
     for _ in range(cluster_count):
-        cx = random.randrange(width)
-        cy = random.randrange(height)
+        cx = rng.randrange(width)
+        cy = rng.randrange(height)
         radius = int((tiles_per_cluster / 3.14) ** 0.5)
-        radius = max(10, int(radius * random.uniform(1 - cluster_spread, 1 + cluster_spread)))
+        radius = max(10, int(radius * rng.uniform(1 - cluster_spread, 1 + cluster_spread)))
         for y in range(max(0, cy - radius), min(height, cy + radius + 1)):
             dy = y - cy
             dx = int((radius**2 - dy**2) ** 0.5)
@@ -154,6 +179,7 @@ def place_mountains(
     altitude_map_out: List[List[float]] | None,
     obstacles_set: Set[Coord],
     obstacle_threshold: float = 0.75,
+    rng: random.Random | None = None,
 ) -> Tuple[TileGrid, Set[Coord]]:
     """Create simple mountain clusters quickly.
 
@@ -166,6 +192,7 @@ def place_mountains(
 
     width = len(tiles[0])
     height = len(tiles)
+    rng = rng or random
     total = int(width * height * total_area_pct / 100)
     if total <= 0:
         return tiles, obstacles_set
@@ -173,9 +200,10 @@ def place_mountains(
     cluster_count = max(1, int(peak_density * 10))
     tiles_per_cluster = max(1, total // cluster_count)
     code = TILE_CODES["mountain"]
+    rand = rng.random
     for _ in range(cluster_count):
-        cx = random.randrange(width)
-        cy = random.randrange(height)
+        cx = rng.randrange(width)
+        cy = rng.randrange(height)
         radius = int((tiles_per_cluster / 3.14) ** 0.5)
         radius = max(10, radius)
         for y in range(max(0, cy - radius), min(height, cy + radius + 1)):
@@ -185,7 +213,7 @@ def place_mountains(
             end = min(width, cx + dx + 1)
             tiles[y][start:end] = bytearray([code]) * (end - start)
             for x in range(start, end):
-                alt = random.random()
+                alt = rand()
                 if altitude_map_out is not None:
                     altitude_map_out[y][x] = alt
                 if alt >= obstacle_threshold:
@@ -202,22 +230,28 @@ def place_swamp_desert(
     desert_pct: float,
     clumpiness: float,
     obstacles_set: Set[Coord],
+    rng: random.Random | None = None,
 ) -> Tuple[TileGrid, Set[Coord]]:
     """Place swamp and desert patches on the map."""
 
     width = len(tiles[0])
     height = len(tiles)
+    rng = rng or random
     total = width * height
+    plain = bytes([TILE_CODES["plain"]])
 
     def _clusters(tile: int, pct: float) -> None:
         count = int(total * pct / 100)
         if count <= 0:
             return
+        # Maps plain to ``tile`` and every other code to itself so a whole
+        # row span can be masked with one ``translate`` call.
+        table = bytes.maketrans(plain, bytes([tile]))
         cluster_count = max(1, int((1 - clumpiness) * 5) + 1)
         tiles_per_cluster = max(1, count // cluster_count)
         for _ in range(cluster_count):
-            cx = random.randrange(width)
-            cy = random.randrange(height)
+            cx = rng.randrange(width)
+            cy = rng.randrange(height)
             radius = int((tiles_per_cluster / 3.14) ** 0.5)
             radius = max(10, radius)
             for y in range(max(0, cy - radius), min(height, cy + radius + 1)):
@@ -225,9 +259,8 @@ def place_swamp_desert(
                 dx = int((radius**2 - dy**2) ** 0.5)
                 start = max(0, cx - dx)
                 end = min(width, cx + dx + 1)
-                for x in range(start, end):
-                    if tiles[y][x] == TILE_CODES["plain"]:
-                        tiles[y][x] = tile
+                row = tiles[y]
+                row[start:end] = row[start:end].translate(table)
 
     _clusters(TILE_CODES["swamp"], swamp_pct)
     _clusters(TILE_CODES["desert"], desert_pct)